@@ -274,7 +274,7 @@ def run_benchmark(
             ctx = build_calendar_context(sidecar)
             calendar_context_text = ctx.events_text
             owner_name = sidecar.owner
-            reference_dt = datetime.fromisoformat(sidecar.reference_datetime)
+            reference_dt = sidecar.reference_datetime
 
         # Rate limit: delay between API calls (skip before first).
         if idx > 1 and delay_s > 0:
@@ -14,13 +14,18 @@ but does not block creation.
 
 All API calls are wrapped with the :func:`~cal_ai.calendar.exceptions.with_retry`
 decorator for automatic retry on transient failures.
+
+:func:`parse_api_datetime` is the shared, cached parser for event times
+returned by the API.
 """
 
 from __future__ import annotations
 
 import contextlib
 import logging
+from collections.abc import Iterable, Iterator
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Any
 
 from google.oauth2.credentials import Credentials
@@ -38,6 +43,10 @@ _SEARCH_WINDOW = timedelta(hours=24)
 # Google Calendar API calendar identifier for the primary calendar.
 _PRIMARY_CALENDAR = "primary"
 
+# Partial-response selector for internal duplicate/conflict/match lookups,
+# which only read these fields.
+_LOOKUP_FIELDS = "items(id,summary,start,end),nextPageToken"
+
 
 class GoogleCalendarClient:
     """High-level client for Google Calendar CRUD operations.
@@ -69,6 +78,7 @@ class GoogleCalendarClient:
         self._timezone = timezone
         self._owner_email = owner_email
         self._service = service or build("calendar", "v3", credentials=credentials)
+        self._events = self._service.events()
 
     # ------------------------------------------------------------------
     # Credential refresh hook (used by @with_retry on 401)
@@ -85,6 +95,7 @@ class GoogleCalendarClient:
 
         self._credentials.refresh(Request())
         self._service = build("calendar", "v3", credentials=self._credentials)
+        self._events = self._service.events()
         logger.info("Credentials refreshed and service rebuilt")
 
     # ------------------------------------------------------------------
@@ -92,7 +103,11 @@ class GoogleCalendarClient:
     # ------------------------------------------------------------------
 
     @with_retry()
-    def create_event(self, event: ValidatedEvent) -> dict | None:
+    def create_event(
+        self,
+        event: ValidatedEvent,
+        existing_events: list[dict] | None = None,
+    ) -> dict | None:
         """Create a new event on Google Calendar.
 
         Before inserting, checks for duplicates (same title + overlapping
@@ -101,6 +116,11 @@ class GoogleCalendarClient:
 
         Args:
             event: The validated event to create.
+            existing_events: Optional pre-fetched events covering the
+                event's search window (see :meth:`list_events_around`).
+                When given, no ``list()`` call is made and the created
+                event is appended so later checks against the same list
+                see it.
 
         Returns:
             The API response ``dict`` for the created event, or ``None``
@@ -109,9 +129,12 @@ class GoogleCalendarClient:
         body = map_to_google_event(event, self._timezone, self._owner_email)
 
         # Fetch existing events in the surrounding time window for checks.
-        window_start = event.start_time - _SEARCH_WINDOW
-        window_end = event.end_time + _SEARCH_WINDOW
-        existing = self._list_events_raw(window_start, window_end)
+        if existing_events is not None:
+            existing = existing_events
+        else:
+            window_start = event.start_time - _SEARCH_WINDOW
+            window_end = event.end_time + _SEARCH_WINDOW
+            existing = self._list_events_raw(window_start, window_end, fields=_LOOKUP_FIELDS)
 
         # Duplicate check.
         duplicate = self._is_duplicate(event, existing)
@@ -134,7 +157,9 @@ class GoogleCalendarClient:
                 ", ".join(titles),
             )
 
-        result = self._service.events().insert(calendarId=_PRIMARY_CALENDAR, body=body).execute()
+        result = self._events.insert(calendarId=_PRIMARY_CALENDAR, body=body).execute()
+        if existing_events is not None:
+            existing_events.append({**body, **result})
         logger.info(
             "Created event '%s' (id=%s)",
             event.title,
@@ -172,6 +197,33 @@ class GoogleCalendarClient:
         )
         return events
 
+    @with_retry()
+    def list_events_around(self, events: list[ValidatedEvent]) -> list[dict]:
+        """List existing events covering the search windows of *events*.
+
+        Fetches, in one paginated request, every event that any of the
+        per-event duplicate/match lookups would see.  Pass the result as
+        ``existing_events`` to :meth:`create_event`,
+        :meth:`find_and_update_event` and :meth:`find_and_delete_event`
+        to avoid one ``list()`` round-trip per event.
+
+        Args:
+            events: The events about to be synced.  Must not be empty.
+
+        Returns:
+            A list of Google Calendar event resource dicts (partial
+            resources: ``id``, ``summary``, ``start`` and ``end`` only).
+        """
+        window_start = min(e.start_time for e in events) - _SEARCH_WINDOW
+        window_end = max(e.end_time for e in events) + _SEARCH_WINDOW
+        existing = self._list_events_raw(window_start, window_end, fields=_LOOKUP_FIELDS)
+        logger.info(
+            "Prefetched %d existing event(s) for %d event(s) to sync",
+            len(existing),
+            len(events),
+        )
+        return existing
+
     # ------------------------------------------------------------------
     # Update
     # ------------------------------------------------------------------
@@ -191,16 +243,18 @@ class GoogleCalendarClient:
             CalendarNotFoundError: If the event ID does not exist.
         """
         body = map_to_google_event(event, self._timezone, self._owner_email)
-        result = (
-            self._service.events()
-            .update(calendarId=_PRIMARY_CALENDAR, eventId=event_id, body=body)
-            .execute()
-        )
+        result = self._events.update(
+            calendarId=_PRIMARY_CALENDAR, eventId=event_id, body=body
+        ).execute()
         logger.info("Updated event '%s' (id=%s)", event.title, event_id)
         return result
 
     @with_retry()
-    def find_and_update_event(self, event: ValidatedEvent) -> dict | None:
+    def find_and_update_event(
+        self,
+        event: ValidatedEvent,
+        existing_events: list[dict] | None = None,
+    ) -> dict | None:
         """Search for an existing event by title and time, then update it.
 
         Looks for events with a matching title (case-insensitive) that
@@ -210,14 +264,21 @@ class GoogleCalendarClient:
         Args:
             event: The validated event containing the updated data and
                 search criteria (title + time).
+            existing_events: Optional pre-fetched events to search instead
+                of calling ``list()``.  The matched entry is replaced with
+                the updated event.
 
         Returns:
             The API response ``dict`` for the updated event, or ``None``
             if no matching event was found.
         """
-        window_start = event.start_time - _SEARCH_WINDOW
-        window_end = event.end_time + _SEARCH_WINDOW
-        existing = self._list_events_raw(window_start, window_end)
+        if existing_events is not None:
+            existing: Iterable[dict] = existing_events
+        else:
+            window_start = event.start_time - _SEARCH_WINDOW
+            window_end = event.end_time + _SEARCH_WINDOW
+            # Pages are fetched lazily, so paging stops at the first match.
+            existing = self._iter_events_raw(window_start, window_end, fields=_LOOKUP_FIELDS)
 
         match = self._find_by_title_and_time(event, existing)
         if match is None:
@@ -228,15 +289,13 @@ class GoogleCalendarClient:
             return None
 
         body = map_to_google_event(event, self._timezone, self._owner_email)
-        result = (
-            self._service.events()
-            .update(
-                calendarId=_PRIMARY_CALENDAR,
-                eventId=match["id"],
-                body=body,
-            )
-            .execute()
-        )
+        result = self._events.update(
+            calendarId=_PRIMARY_CALENDAR,
+            eventId=match["id"],
+            body=body,
+        ).execute()
+        if existing_events is not None:
+            existing_events[existing_events.index(match)] = {**match, **body, **result}
         logger.info(
             "Found and updated event '%s' (id=%s)",
             event.title,
@@ -258,11 +317,15 @@ class GoogleCalendarClient:
         Raises:
             CalendarNotFoundError: If the event ID does not exist.
         """
-        self._service.events().delete(calendarId=_PRIMARY_CALENDAR, eventId=event_id).execute()
+        self._events.delete(calendarId=_PRIMARY_CALENDAR, eventId=event_id).execute()
         logger.info("Deleted event (id=%s)", event_id)
 
     @with_retry()
-    def find_and_delete_event(self, event: ValidatedEvent) -> bool:
+    def find_and_delete_event(
+        self,
+        event: ValidatedEvent,
+        existing_events: list[dict] | None = None,
+    ) -> bool:
         """Search for an existing event by title and time, then delete it.
 
         Looks for events with a matching title (case-insensitive) that
@@ -271,14 +334,20 @@ class GoogleCalendarClient:
         Args:
             event: The validated event containing the search criteria
                 (title + time).
+            existing_events: Optional pre-fetched events to search instead
+                of calling ``list()``.  The deleted entry is removed.
 
         Returns:
             ``True`` if a matching event was found and deleted, ``False``
             if no match was found.
         """
-        window_start = event.start_time - _SEARCH_WINDOW
-        window_end = event.end_time + _SEARCH_WINDOW
-        existing = self._list_events_raw(window_start, window_end)
+        if existing_events is not None:
+            existing: Iterable[dict] = existing_events
+        else:
+            window_start = event.start_time - _SEARCH_WINDOW
+            window_end = event.end_time + _SEARCH_WINDOW
+            # Pages are fetched lazily, so paging stops at the first match.
+            existing = self._iter_events_raw(window_start, window_end, fields=_LOOKUP_FIELDS)
 
         match = self._find_by_title_and_time(event, existing)
         if match is None:
@@ -288,7 +357,9 @@ class GoogleCalendarClient:
             )
             return False
 
-        self._service.events().delete(calendarId=_PRIMARY_CALENDAR, eventId=match["id"]).execute()
+        self._events.delete(calendarId=_PRIMARY_CALENDAR, eventId=match["id"]).execute()
+        if existing_events is not None:
+            existing_events.remove(match)
         logger.info(
             "Found and deleted event '%s' (id=%s)",
             event.title,
@@ -309,7 +380,7 @@ class GoogleCalendarClient:
 
         A duplicate is defined as an existing event with:
 
-        - The **same title** (case-insensitive comparison), AND
+        - The **same title** (case-insensitive, via ``str.casefold``), AND
         - **Overlapping time** (``event_a.start < event_b.end AND
           event_b.start < event_a.end``).
 
@@ -324,9 +395,9 @@ class GoogleCalendarClient:
             The first matching existing event ``dict``, or ``None`` if no
             duplicate is found.
         """
+        title = event.title.casefold()
         for existing in existing_events:
-            existing_title = existing.get("summary", "")
-            if existing_title.lower() != event.title.lower():
+            if existing.get("summary", "").casefold() != title:
                 continue
 
             # Parse existing event times.
@@ -386,6 +457,7 @@ class GoogleCalendarClient:
         self,
         time_min: datetime,
         time_max: datetime,
+        fields: str | None = None,
     ) -> list[dict]:
         """Fetch events from the API with pagination.
 
@@ -396,40 +468,57 @@ class GoogleCalendarClient:
         Args:
             time_min: Start of the time range.
             time_max: End of the time range.
+            fields: Optional partial-response selector passed to the API.
 
         Returns:
             A flat list of event resource dicts from all pages.
         """
-        all_events: list[dict] = []
+        return list(self._iter_events_raw(time_min, time_max, fields=fields))
+
+    def _iter_events_raw(
+        self,
+        time_min: datetime,
+        time_max: datetime,
+        fields: str | None = None,
+    ) -> Iterator[dict]:
+        """Yield events from the API page by page.
+
+        The next page is only requested once the caller has consumed the
+        current one, so a search that stops early skips the remaining
+        round-trips.  Like :meth:`_list_events_raw` this is not retried
+        itself; it must be consumed inside a ``@with_retry`` method.
+
+        Args:
+            time_min: Start of the time range.
+            time_max: End of the time range.
+            fields: Optional partial-response selector passed to the API.
+
+        Yields:
+            Event resource dicts in API order.
+        """
         page_token: str | None = None
 
         while True:
-            response = (
-                self._service.events()
-                .list(
-                    calendarId=_PRIMARY_CALENDAR,
-                    timeMin=time_min.isoformat() + "Z",
-                    timeMax=time_max.isoformat() + "Z",
-                    singleEvents=True,
-                    orderBy="startTime",
-                    pageToken=page_token,
-                )
-                .execute()
-            )
+            response = self._events.list(
+                calendarId=_PRIMARY_CALENDAR,
+                timeMin=time_min.isoformat() + "Z",
+                timeMax=time_max.isoformat() + "Z",
+                singleEvents=True,
+                orderBy="startTime",
+                pageToken=page_token,
+                fields=fields,
+            ).execute()
 
-            items = response.get("items", [])
-            all_events.extend(items)
+            yield from response.get("items", [])
 
             page_token = response.get("nextPageToken")
             if page_token is None:
-                break
-
-        return all_events
+                return
 
     @staticmethod
     def _find_by_title_and_time(
         event: ValidatedEvent,
-        existing_events: list[dict],
+        existing_events: Iterable[dict],
     ) -> dict | None:
         """Find an existing event matching by title and overlapping time.
 
@@ -438,14 +527,15 @@ class GoogleCalendarClient:
 
         Args:
             event: The event with title and time to match.
-            existing_events: List of Google Calendar event resource dicts.
+            existing_events: Google Calendar event resource dicts; consumed
+                only up to the first match.
 
         Returns:
             The first matching event, or ``None``.
         """
+        title = event.title.casefold()
         for existing in existing_events:
-            existing_title = existing.get("summary", "")
-            if existing_title.lower() != event.title.lower():
+            if existing.get("summary", "").casefold() != title:
                 continue
 
             ex_start, ex_end = _parse_event_times(existing)
@@ -492,15 +582,34 @@ def _parse_event_times(
 
     if start_str is not None:
         with contextlib.suppress(ValueError):
-            start_dt = datetime.fromisoformat(start_str)
-            # Strip tzinfo so comparisons with naive ValidatedEvent datetimes work.
-            if start_dt.tzinfo is not None:
-                start_dt = start_dt.replace(tzinfo=None)
+            start_dt = parse_api_datetime(start_str)
 
     if end_str is not None:
         with contextlib.suppress(ValueError):
-            end_dt = datetime.fromisoformat(end_str)
-            if end_dt.tzinfo is not None:
-                end_dt = end_dt.replace(tzinfo=None)
+            end_dt = parse_api_datetime(end_str)
 
     return start_dt, end_dt
+
+
+@lru_cache(maxsize=2048)
+def parse_api_datetime(value: str) -> datetime:
+    """Parse an API ``dateTime``/``date`` string into a naive datetime.
+
+    Cached because list responses repeat the same timestamps (every
+    duplicate, conflict and lookup scan re-parses the same events).
+    Also used by :mod:`cal_ai.calendar.context` to sort prompt context.
+
+    Args:
+        value: An ISO 8601 ``dateTime`` or ``date`` string from the API.
+
+    Returns:
+        The parsed datetime with any ``tzinfo`` stripped.
+
+    Raises:
+        ValueError: If *value* is not a valid ISO 8601 string.
+    """
+    parsed = datetime.fromisoformat(value)
+    # Strip tzinfo so comparisons with naive ValidatedEvent datetimes work.
+    if parsed.tzinfo is not None:
+        parsed = parsed.replace(tzinfo=None)
+    return parsed
@@ -17,7 +17,7 @@ import logging
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 
-from cal_ai.calendar.client import GoogleCalendarClient
+from cal_ai.calendar.client import GoogleCalendarClient, parse_api_datetime
 
 logger = logging.getLogger(__name__)
 
@@ -77,6 +77,22 @@ def _format_event_line(idx: int, event: dict) -> str:
     return " | ".join(parts)
 
 
+def _event_meta(event: dict) -> dict[str, str]:
+    """Extract the title and start time shown for matched events in demo output.
+
+    Args:
+        event: A Google Calendar event resource dict.
+
+    Returns:
+        A dict with ``title`` and ``start_time`` keys.
+    """
+    start_obj = event.get("start", {})
+    return {
+        "title": event.get("summary", "(No title)"),
+        "start_time": start_obj.get("dateTime") or start_obj.get("date", ""),
+    }
+
+
 def _parse_sort_key(event: dict) -> datetime:
     """Extract a datetime from an event for chronological sorting.
 
@@ -96,11 +112,7 @@ def _parse_sort_key(event: dict) -> datetime:
         return datetime.max
 
     try:
-        dt = datetime.fromisoformat(start_str)
-        # Strip tzinfo for consistent sorting with naive datetimes.
-        if dt.tzinfo is not None:
-            dt = dt.replace(tzinfo=None)
-        return dt
+        return parse_api_datetime(start_str)
     except ValueError:
         return datetime.max
 
@@ -146,25 +158,10 @@ def fetch_calendar_context(
     sorted_events = sorted(raw_events, key=_parse_sort_key)
 
     # Build ID map, event metadata, and formatted lines.
-    id_map: dict[int, str] = {}
-    event_meta: dict[int, dict[str, str]] = {}
-    lines: list[str] = []
-
-    for i, event in enumerate(sorted_events, start=1):
-        event_id = event.get("id", "")
-        id_map[i] = event_id
-
-        # Store metadata for demo output (title + start time).
-        start_obj = event.get("start", {})
-        start_str = start_obj.get("dateTime") or start_obj.get("date", "")
-        event_meta[i] = {
-            "title": event.get("summary", "(No title)"),
-            "start_time": start_str,
-        }
-
-        lines.append(_format_event_line(i, event))
-
-    events_text = "\n".join(lines)
+    numbered = list(enumerate(sorted_events, start=1))
+    id_map = {i: event.get("id", "") for i, event in numbered}
+    event_meta = {i: _event_meta(event) for i, event in numbered}
+    events_text = "\n".join(_format_event_line(i, event) for i, event in numbered)
 
     return CalendarContext(
         events_text=events_text,
@@ -51,19 +51,20 @@ def map_to_google_event(
             f"start_time ({event.start_time.isoformat()})"
         )
 
+    # Only the owner becomes a Google Calendar attendee (has an email).
+    # Other names from the LLM are listed in the description instead.
+    attendee_entries, other_attendees = _split_attendees(event.attendees, owner_email)
+
     body: dict = {
         "summary": event.title,
         "start": _format_datetime(event.start_time, timezone),
         "end": _format_datetime(event.end_time, timezone),
-        "description": _build_description(event, owner_email),
+        "description": _build_description(event, other_attendees),
     }
 
     if event.location:
         body["location"] = event.location
 
-    # Only add the owner as a Google Calendar attendee (has an email).
-    # Other names from the LLM are listed in the description instead.
-    attendee_entries = _build_attendees(event.attendees, owner_email)
     if attendee_entries:
         body["attendees"] = attendee_entries
 
@@ -98,7 +99,7 @@ def _format_datetime(dt: datetime, timezone: str) -> dict:
     }
 
 
-def _build_description(event: ValidatedEvent, owner_email: str) -> str:
+def _build_description(event: ValidatedEvent, other_attendees: list[str]) -> str:
     """Build the event description with LLM reasoning for observability.
 
     Includes the extraction reasoning, any assumptions made, and a list of
@@ -107,8 +108,8 @@ def _build_description(event: ValidatedEvent, owner_email: str) -> str:
 
     Args:
         event: The validated event.
-        owner_email: The calendar owner's email (used to identify the owner
-            in the attendee list).
+        other_attendees: Non-owner attendee names, as split off by
+            :func:`_split_attendees`.
 
     Returns:
         A multi-line description string.
@@ -124,7 +125,6 @@ def _build_description(event: ValidatedEvent, owner_email: str) -> str:
         sections.append(f"Assumptions: {assumptions_text}")
 
     # Other attendees (non-owner names)
-    other_attendees = [name for name in event.attendees if name.lower() != owner_email.lower()]
     if other_attendees:
         names = ", ".join(other_attendees)
         sections.append(f"Other attendees: {names}")
@@ -132,11 +132,11 @@ def _build_description(event: ValidatedEvent, owner_email: str) -> str:
     return "\n".join(sections)
 
 
-def _build_attendees(
+def _split_attendees(
     attendees: list[str],
     owner_email: str,
-) -> list[dict]:
-    """Build the attendees list for the Google Calendar API.
+) -> tuple[list[dict], list[str]]:
+    """Split attendees into API attendee entries and other names in one pass.
 
     Only the calendar owner is mapped to a proper attendee entry (with their
     email address).  Other attendees extracted by the LLM are names without
@@ -147,13 +147,18 @@ def _build_attendees(
         owner_email: The Google account email of the calendar owner.
 
     Returns:
-        A list of attendee dicts.  May be empty if the owner is not in the
-        attendee list.
+        A ``(entries, other_names)`` tuple.  ``entries`` is the attendees
+        list for the API and may be empty if the owner is not in the
+        attendee list; ``other_names`` keeps the non-owner names in order.
     """
     entries: list[dict] = []
+    other_names: list[str] = []
+    owner = owner_email.lower()
 
     for name in attendees:
-        if name.lower() == owner_email.lower():
+        if name.lower() == owner:
             entries.append({"email": owner_email})
+        else:
+            other_names.append(name)
 
-    return entries
+    return entries, other_names
@@ -40,6 +40,11 @@ def sync_events(
       A ``False`` return means no matching event was found and is counted as
       *skipped*.
 
+    Existing events are listed once up front, covering every event's
+    search window, and that snapshot is kept current as events are
+    created, updated, and deleted.  If the prefetch fails, each event
+    falls back to its own lookup.
+
     Processing continues even if individual events fail.  Failures are
     recorded in the returned :class:`SyncResult` for inspection.
 
@@ -55,9 +60,11 @@ def sync_events(
 
     logger.info("Starting sync of %d event(s)", len(events))
 
+    existing = _prefetch_existing(events, client)
+
     for event in events:
         try:
-            _dispatch_event(event, client, result)
+            _dispatch_event(event, client, result, existing)
         except Exception as exc:
             logger.error(
                 "Failed to sync event '%s' (action=%s): %s",
@@ -87,10 +94,34 @@ def sync_events(
     return result
 
 
+def _prefetch_existing(
+    events: list[ValidatedEvent],
+    client: GoogleCalendarClient,
+) -> list[dict] | None:
+    """List the existing events for all of *events* in one request.
+
+    Args:
+        events: The events about to be synced.
+        client: The calendar client.
+
+    Returns:
+        The shared list of existing events, or ``None`` if there is nothing
+        to sync or the request failed (callers then look up per event).
+    """
+    if not events:
+        return None
+    try:
+        return client.list_events_around(events)
+    except Exception as exc:
+        logger.warning("Prefetch of existing events failed, looking up per event: %s", exc)
+        return None
+
+
 def _dispatch_event(
     event: ValidatedEvent,
     client: GoogleCalendarClient,
     result: SyncResult,
+    existing: list[dict] | None = None,
 ) -> None:
     """Dispatch a single event to the appropriate client method.
 
@@ -100,6 +131,8 @@ def _dispatch_event(
         event: The validated event to process.
         client: The calendar client.
         result: The running sync result to update.
+        existing: Shared snapshot of existing events, or ``None`` to let
+            the client look them up itself.
 
     Raises:
         ValueError: If ``event.action`` is not one of
@@ -110,11 +143,11 @@ def _dispatch_event(
     action = event.action
 
     if action == "create":
-        _handle_create(event, client, result)
+        _handle_create(event, client, result, existing)
     elif action == "update":
-        _handle_update(event, client, result)
+        _handle_update(event, client, result, existing)
     elif action == "delete":
-        _handle_delete(event, client, result)
+        _handle_delete(event, client, result, existing)
     else:
         raise ValueError(f"Unknown event action: {action!r}")
 
@@ -123,6 +156,7 @@ def _handle_create(
     event: ValidatedEvent,
     client: GoogleCalendarClient,
     result: SyncResult,
+    existing: list[dict] | None = None,
 ) -> None:
     """Handle a create action for a single event.
 
@@ -130,8 +164,9 @@ def _handle_create(
         event: The event to create.
         client: The calendar client.
         result: The running sync result to update.
+        existing: Shared snapshot of existing events, or ``None``.
     """
-    response = client.create_event(event)
+    response = client.create_event(event, existing_events=existing)
     if response is None:
         # Duplicate detected -- event was skipped.
         result.skipped += 1
@@ -145,6 +180,7 @@ def _handle_update(
     event: ValidatedEvent,
     client: GoogleCalendarClient,
     result: SyncResult,
+    existing: list[dict] | None = None,
 ) -> None:
     """Handle an update action for a single event.
 
@@ -152,8 +188,9 @@ def _handle_update(
         event: The event containing updated data and search criteria.
         client: The calendar client.
         result: The running sync result to update.
+        existing: Shared snapshot of existing events, or ``None``.
     """
-    response = client.find_and_update_event(event)
+    response = client.find_and_update_event(event, existing_events=existing)
     if response is None:
         # No matching event found to update.
         result.skipped += 1
@@ -167,6 +204,7 @@ def _handle_delete(
     event: ValidatedEvent,
     client: GoogleCalendarClient,
     result: SyncResult,
+    existing: list[dict] | None = None,
 ) -> None:
     """Handle a delete action for a single event.
 
@@ -174,8 +212,9 @@ def _handle_delete(
         event: The event containing search criteria for deletion.
         client: The calendar client.
         result: The running sync result to update.
+        existing: Shared snapshot of existing events, or ``None``.
     """
-    deleted = client.find_and_delete_event(event)
+    deleted = client.find_and_delete_event(event, existing_events=existing)
     if not deleted:
         # No matching event found to delete.
         result.skipped += 1
@@ -11,7 +11,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class SyncResult:
     """Aggregated result of syncing extracted events to Google Calendar.
 
@@ -8,6 +8,20 @@ from collections.abc import Generator
 import pytest
 
 
+@pytest.hookimpl(tryfirst=True)
+def pytest_cmdline_main(config: pytest.Config) -> None:
+    """Default to ``--dist=loadfile`` when running under ``pytest-xdist``.
+
+    Keeping every test in a file on the same worker lets module- and
+    session-scoped fixtures be built once per file instead of once per
+    test.  An explicit ``--dist`` on the command line still wins; the
+    live regression target passes ``--dist=load`` because all of its
+    cases live in a single file.
+    """
+    if getattr(config.option, "numprocesses", None) and config.option.dist == "no":
+        config.option.dist = "loadfile"
+
+
 @pytest.fixture()
 def monkeypatch_env(monkeypatch: pytest.MonkeyPatch) -> dict[str, str]:
     """Set all required environment variables to valid defaults.
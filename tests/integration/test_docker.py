@@ -6,47 +6,68 @@ and verify expected configuration strings.  No Docker daemon is required.
 
 from __future__ import annotations
 
-from pathlib import Path
+import os
 
-DOCKERFILE = Path("Dockerfile")
-DOCKER_COMPOSE = Path("docker-compose.yml")
+import pytest
+
+DOCKERFILE = "Dockerfile"
+DOCKER_COMPOSE = "docker-compose.yml"
+
+# Project root, two levels above this file (tests/integration/).
+_PROJECT_ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..")
+
+
+def _read(path: str) -> str:
+    """Read a UTF-8 text file relative to the project root."""
+    with open(os.path.join(_PROJECT_ROOT, path), encoding="utf-8") as f:
+        return f.read()
+
+
+@pytest.fixture(scope="module")
+def dockerfile_text() -> str:
+    """Dockerfile contents, read once per module."""
+    return _read(DOCKERFILE)
+
+
+@pytest.fixture(scope="module")
+def compose_text() -> str:
+    """docker-compose.yml contents, read once per module."""
+    return _read(DOCKER_COMPOSE)
 
 
 class TestDockerConfig:
     """Validate Docker configuration files contain expected settings."""
 
-    def test_dockerfile_has_correct_entrypoint(self) -> None:
+    def test_dockerfile_has_correct_entrypoint(self, dockerfile_text: str) -> None:
         """Dockerfile ENTRYPOINT contains 'python -m cal_ai'."""
-        content = DOCKERFILE.read_text()
-        assert "python -m cal_ai" in content or 'python", "-m", "cal_ai' in content, (
-            "Dockerfile must contain ENTRYPOINT with 'python -m cal_ai'"
-        )
+        assert (
+            "python -m cal_ai" in dockerfile_text or 'python", "-m", "cal_ai' in dockerfile_text
+        ), "Dockerfile must contain ENTRYPOINT with 'python -m cal_ai'"
 
-    def test_dockerfile_copies_samples(self) -> None:
+    def test_dockerfile_copies_samples(self, dockerfile_text: str) -> None:
         """Dockerfile contains a COPY instruction for samples/."""
-        content = DOCKERFILE.read_text()
-        assert "COPY samples/" in content or "COPY ./samples/" in content, (
+        assert "COPY samples/" in dockerfile_text or "COPY ./samples/" in dockerfile_text, (
             "Dockerfile must COPY samples/ directory into the image"
         )
 
-    def test_docker_compose_mounts_env(self) -> None:
+    def test_docker_compose_mounts_env(self, compose_text: str) -> None:
         """docker-compose.yml references .env via env_file or volumes."""
-        content = DOCKER_COMPOSE.read_text()
-        has_env_file = "env_file" in content and ".env" in content
-        has_env_volume = ".env" in content and "volumes" in content
+        has_env_file = "env_file" in compose_text and ".env" in compose_text
+        has_env_volume = ".env" in compose_text and "volumes" in compose_text
         assert has_env_file or has_env_volume, (
             "docker-compose.yml must include .env in env_file or volumes"
         )
 
-    def test_docker_compose_has_default_command(self) -> None:
+    def test_docker_compose_has_default_command(
+        self,
+        dockerfile_text: str,
+        compose_text: str,
+    ) -> None:
         """docker-compose.yml or Dockerfile specifies a default transcript path."""
         # The default command is set in the Dockerfile CMD, which docker-compose
         # inherits.  We check the Dockerfile for CMD with a transcript path.
-        dockerfile_content = DOCKERFILE.read_text()
-        compose_content = DOCKER_COMPOSE.read_text()
-
-        has_cmd_in_dockerfile = "CMD" in dockerfile_content and "samples/" in dockerfile_content
-        has_command_in_compose = "command" in compose_content and "samples/" in compose_content
+        has_cmd_in_dockerfile = "CMD" in dockerfile_text and "samples/" in dockerfile_text
+        has_command_in_compose = "command" in compose_text and "samples/" in compose_text
 
         assert has_cmd_in_dockerfile or has_command_in_compose, (
             "A default transcript path must be specified via Dockerfile CMD or "
@@ -8,10 +8,13 @@ calendar sync, and demo output -- hangs together correctly.
 
 from __future__ import annotations
 
+import re
 from datetime import datetime
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
+from cal_ai import pipeline as _pipeline_mod
 from cal_ai.calendar.context import CalendarContext
 from cal_ai.demo_output import format_pipeline_result
 from cal_ai.exceptions import ExtractionError
@@ -30,6 +33,13 @@ FROZEN_NOW = datetime(2026, 2, 18, 10, 0, 0)
 
 SAMPLES = Path("samples")
 
+# Demo-output markers, matched in one pass over the formatted output.
+_STAGE_RE = re.compile(r"STAGE 1|STAGE 2|STAGE 3|SUMMARY")
+_ACTIONS_RE = re.compile(r"\[(CREATE|UPDATE|DELETE)\]")
+
+# Shared empty calendar context; the pipeline only reads from it.
+_EMPTY_CONTEXT = CalendarContext()
+
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -100,16 +110,18 @@ def _run_e2e(
     Returns a tuple of ``(result, mocks)`` where *mocks* is a namespace
     with ``gemini``, ``client``, etc.
     """
-    extraction = _make_extraction(extracted_events)
-    validated = [_make_validated(e) for e in extracted_events]
-
     # -- Mock GeminiClient instance ----------------------------------------
     mock_gemini = MagicMock()
     if extract_side_effect is not None:
+        # The pipeline bails at extraction; no need to build a result.
         mock_gemini.extract_events.side_effect = extract_side_effect
     else:
-        mock_gemini.extract_events.return_value = extraction
-    mock_gemini.validate_events.return_value = validated
+        mock_gemini.extract_events.return_value = _make_extraction(extracted_events)
+    # Validate lazily so tests whose pipeline never reaches validation
+    # (e.g. LLM failure) skip building ValidatedEvent models.
+    mock_gemini.validate_events.side_effect = lambda extraction, **_kw: [
+        _make_validated(e) for e in extraction.events
+    ]
     mock_gemini_cls = MagicMock(return_value=mock_gemini)
 
     # -- Mock settings -----------------------------------------------------
@@ -133,21 +145,15 @@ def _run_e2e(
     mock_cal_cls = MagicMock(return_value=mock_client)
 
     # -- Mock fetch_calendar_context -----------------------------------------
-    mock_fetch_context = MagicMock(return_value=CalendarContext())
-
-    class _Mocks:
-        gemini = mock_gemini
-        gemini_cls = mock_gemini_cls
-        client = mock_client
-        cal_cls = mock_cal_cls
-        fetch_context = mock_fetch_context
-
-    with (
-        patch("cal_ai.pipeline.GeminiClient", mock_gemini_cls),
-        patch("cal_ai.pipeline.load_settings", mock_settings_fn),
-        patch("cal_ai.pipeline.get_calendar_credentials", mock_get_creds),
-        patch("cal_ai.pipeline.GoogleCalendarClient", mock_cal_cls),
-        patch("cal_ai.pipeline.fetch_calendar_context", mock_fetch_context),
+    mock_fetch_context = MagicMock(return_value=_EMPTY_CONTEXT)
+
+    with patch.multiple(
+        _pipeline_mod,
+        GeminiClient=mock_gemini_cls,
+        load_settings=mock_settings_fn,
+        get_calendar_credentials=mock_get_creds,
+        GoogleCalendarClient=mock_cal_cls,
+        fetch_calendar_context=mock_fetch_context,
     ):
         result = run_pipeline(
             transcript_path=Path(sample_file),
@@ -156,7 +162,13 @@ def _run_e2e(
             current_datetime=FROZEN_NOW,
         )
 
-    return result, _Mocks()
+    return result, SimpleNamespace(
+        gemini=mock_gemini,
+        gemini_cls=mock_gemini_cls,
+        client=mock_client,
+        cal_cls=mock_cal_cls,
+        fetch_context=mock_fetch_context,
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -351,8 +363,7 @@ class TestEndToEnd:
 
         # Check demo output has both [CREATE] and [UPDATE].
         output = format_pipeline_result(result)
-        assert "[CREATE]" in output
-        assert "[UPDATE]" in output
+        assert {"CREATE", "UPDATE"} <= set(_ACTIONS_RE.findall(output))
 
     def test_e2e_partial_sync_failure(self) -> None:
         """One calendar sync fails, others succeed; failed event has error."""
@@ -427,7 +438,4 @@ class TestEndToEnd:
 
         output = format_pipeline_result(result)
 
-        assert "STAGE 1" in output
-        assert "STAGE 2" in output
-        assert "STAGE 3" in output
-        assert "SUMMARY" in output
+        assert set(_STAGE_RE.findall(output)) == {"STAGE 1", "STAGE 2", "STAGE 3", "SUMMARY"}
@@ -16,12 +16,16 @@ from pathlib import Path
 
 import pytest
 
-from tests.regression.loader import discover_samples
-from tests.regression.schema import SidecarSpec
+from tests.regression.loader import SampleCase, discover_samples
 
 # Root of the samples directory (relative to the project root).
 _SAMPLES_DIR = Path(__file__).resolve().parent.parent.parent / "samples"
 
+# Prefix length to strip from discovered paths to get ``category/name.txt``.
+# Discovered paths are built under _SAMPLES_DIR, so slicing is equivalent
+# to ``relative_to`` without re-splitting both paths per sample.
+_SAMPLES_DIR_LEN = len(_SAMPLES_DIR.as_posix()) + 1
+
 
 def pytest_addoption(parser: pytest.Parser) -> None:
     """Register the ``--live`` CLI flag for live Gemini API tests."""
@@ -59,7 +63,7 @@ def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
 
     Discovers all ``samples/**/*.txt`` files paired with a sibling
     ``.expected.json`` sidecar, and parametrizes the test with
-    ``(txt_path, sidecar)`` tuples.  Test IDs use ``category/stem``
+    :class:`~tests.regression.loader.SampleCase` tuples.  Test IDs use ``category/stem``
     format for easy ``-k`` filtering (e.g., ``-k crud/simple_lunch``).
 
     Tests from the ``samples/long/`` directory are automatically
@@ -75,20 +79,20 @@ def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
         return
 
     ids: list[str] = []
-    argvalues: list[tuple[Path, SidecarSpec]] = []
+    argvalues: list[SampleCase] = []
     marks_list: list[list[pytest.MarkDecorator]] = []
 
-    for txt_path, sidecar in cases:
+    for case in cases:
         # Build test ID as category/stem (e.g., "crud/simple_lunch").
-        rel = txt_path.relative_to(_SAMPLES_DIR)
-        test_id = f"{rel.parent}/{rel.stem}"
+        rel_posix = case.txt_path.as_posix()[_SAMPLES_DIR_LEN:]
+        test_id = rel_posix[: rel_posix.rfind(".")]
 
         ids.append(test_id)
-        argvalues.append((txt_path, sidecar))
+        argvalues.append(case)
 
         # Auto-apply @pytest.mark.slow for samples in the long/ directory.
         item_marks: list[pytest.MarkDecorator] = []
-        if "long" in rel.parts:
+        if "long" in rel_posix.split("/"):
             item_marks.append(pytest.mark.slow)
         marks_list.append(item_marks)
 
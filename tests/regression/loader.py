@@ -2,44 +2,99 @@
 
 Discovers ``.txt`` transcript files paired with ``.expected.json`` sidecars
 and converts sidecar calendar context into the pipeline's
-:class:`~cal_ai.calendar.context.CalendarContext` dataclass.
+:class:`~cal_ai.calendar.context.CalendarContext` dataclass.  Everything a
+regression test needs is built once at discovery into a :class:`SampleCase`.
 """
 
 from __future__ import annotations
 
-import json
+import os
+from collections.abc import Iterator
 from pathlib import Path
+from types import SimpleNamespace
+from typing import NamedTuple
 
 from cal_ai.calendar.context import CalendarContext
 
 from .schema import SidecarSpec
 
+# Response stubs keyed by serialized mock response, shared across sidecars.
+_MOCK_RESPONSES: dict[str, SimpleNamespace] = {}
 
-def discover_samples(base_dir: str | Path) -> list[tuple[Path, SidecarSpec]]:
+
+class SampleCase(NamedTuple):
+    """A discovered regression sample, ready to feed into the pipeline.
+
+    Attributes:
+        txt_path: Path to the ``.txt`` transcript.
+        sidecar: The validated sidecar spec.
+        cal_ctx: Calendar context built once from the sidecar.
+        mock_resp: Gemini response stub for mock mode (see
+            :func:`build_mock_response`).
+    """
+
+    txt_path: Path
+    sidecar: SidecarSpec
+    cal_ctx: CalendarContext
+    mock_resp: SimpleNamespace
+
+
+def _iter_sample_pairs(base_dir: Path) -> Iterator[tuple[Path, Path]]:
+    """Yield ``(txt_path, sidecar_path)`` pairs found under *base_dir*.
+
+    Walks the tree with :func:`os.scandir` and pairs files by name within
+    each directory, so no extra ``stat`` call is needed per sidecar.
+    Symlinked directories are not followed (matching ``Path.rglob``).
+    """
+    stack = [os.fspath(base_dir)]
+    while stack:
+        dir_path = stack.pop()
+        txt_names: list[str] = []
+        sidecar_names: set[str] = set()
+        with os.scandir(dir_path) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(".expected.json"):
+                    sidecar_names.add(entry.name)
+                elif entry.name.endswith(".txt"):
+                    txt_names.append(entry.name)
+
+        for name in txt_names:
+            sidecar_name = name[: -len(".txt")] + ".expected.json"
+            if sidecar_name in sidecar_names:
+                yield Path(dir_path, name), Path(dir_path, sidecar_name)
+
+
+def discover_samples(base_dir: str | Path) -> list[SampleCase]:
     """Discover sample transcripts paired with sidecar JSON files.
 
-    Recursively globs ``**/*.txt`` under *base_dir*, pairs each with a
+    Recursively scans *base_dir* for ``*.txt`` files, pairs each with a
     sibling ``.expected.json`` file, and returns validated
-    ``(txt_path, sidecar)`` tuples.  Samples without a matching sidecar
-    are silently skipped.
+    :class:`SampleCase` tuples.  The calendar context and mock response
+    are built here, once per sample, so tests do not rebuild them per
+    run.  Samples without a matching sidecar are silently
+    skipped.
 
     Args:
         base_dir: Root directory to search for samples.
 
     Returns:
-        A sorted list of ``(txt_path, SidecarSpec)`` tuples, ordered by
-        the transcript file path for deterministic test ordering.
+        A sorted list of :class:`SampleCase` tuples, ordered by the
+        transcript file path for deterministic test ordering.
     """
-    base = Path(base_dir)
-    results: list[tuple[Path, SidecarSpec]] = []
-
-    for txt_path in sorted(base.rglob("*.txt")):
-        sidecar_path = txt_path.with_suffix(".expected.json")
-        if sidecar_path.exists():
-            sidecar = load_sidecar(sidecar_path)
-            results.append((txt_path, sidecar))
-
-    return results
+    cases: list[SampleCase] = []
+    for txt_path, sidecar_path in sorted(_iter_sample_pairs(Path(base_dir))):
+        sidecar = load_sidecar(sidecar_path)
+        cases.append(
+            SampleCase(
+                txt_path=txt_path,
+                sidecar=sidecar,
+                cal_ctx=build_calendar_context(sidecar),
+                mock_resp=build_mock_response(sidecar),
+            )
+        )
+    return cases
 
 
 def load_sidecar(json_path: str | Path) -> SidecarSpec:
@@ -52,13 +107,11 @@ def load_sidecar(json_path: str | Path) -> SidecarSpec:
         A validated :class:`SidecarSpec` instance.
 
     Raises:
-        pydantic.ValidationError: If the JSON does not match the schema.
-        json.JSONDecodeError: If the file is not valid JSON.
+        pydantic.ValidationError: If the file is not valid JSON or does
+            not match the schema.
         FileNotFoundError: If the file does not exist.
     """
-    path = Path(json_path)
-    data = json.loads(path.read_text(encoding="utf-8"))
-    return SidecarSpec.model_validate(data)
+    return SidecarSpec.model_validate_json(Path(json_path).read_bytes())
 
 
 def build_calendar_context(sidecar: SidecarSpec) -> CalendarContext:
@@ -85,22 +138,46 @@ def build_calendar_context(sidecar: SidecarSpec) -> CalendarContext:
     id_map: dict[int, str] = {}
     event_meta: dict[int, dict[str, str]] = {}
     lines: list[str] = []
+    append_line = lines.append
 
+    # Single pass: fill the ID map, metadata and formatted lines together.
     for i, event in enumerate(sidecar.calendar_context, start=1):
         id_map[i] = event.id
         event_meta[i] = {
             "title": event.summary,
             "start_time": event.start,
         }
-
-        parts = [f"[{i}] {event.summary}", f"{event.start} - {event.end}"]
         if event.location:
-            parts.append(event.location)
-        lines.append(" | ".join(parts))
+            append_line(f"[{i}] {event.summary} | {event.start} - {event.end} | {event.location}")
+        else:
+            append_line(f"[{i}] {event.summary} | {event.start} - {event.end}")
 
     return CalendarContext(
         events_text="\n".join(lines),
         id_map=id_map,
-        event_count=len(sidecar.calendar_context),
+        event_count=len(lines),
         event_meta=event_meta,
     )
+
+
+def build_mock_response(sidecar: SidecarSpec) -> SimpleNamespace:
+    """Build a stub ``generate_content`` return value from sidecar data.
+
+    The stub's ``.text`` attribute holds the sidecar's cached
+    JSON-serialized ``mock_llm_response``, mimicking the Gemini SDK
+    response object.  It has no ``usage_metadata``, which the client
+    reads with ``getattr(..., None)``.
+
+    Args:
+        sidecar: A validated sidecar spec with ``mock_llm_response``.
+
+    Sidecars with identical mock responses share one stub.
+
+    Returns:
+        A ``SimpleNamespace`` that behaves like a Gemini response object.
+    """
+    text = sidecar.mock_llm_text
+    resp = _MOCK_RESPONSES.get(text)
+    if resp is None:
+        resp = _MOCK_RESPONSES[text] = SimpleNamespace(text=text)
+    return resp
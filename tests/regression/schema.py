@@ -7,9 +7,16 @@ calendar context, and a mock LLM response for deterministic testing.
 
 from __future__ import annotations
 
+import json
+from datetime import datetime
+from functools import cached_property
 from typing import Any, Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+# Sidecars are read-only fixtures: freeze them, reject unknown keys so typos
+# in hand-written JSON fail loudly, and never revalidate nested instances.
+_SIDECAR_CONFIG = ConfigDict(frozen=True, extra="forbid", revalidate_instances="never")
 
 
 class SidecarCalendarEvent(BaseModel):
@@ -26,6 +33,8 @@ class SidecarCalendarEvent(BaseModel):
         location: Event location, or ``None``.
     """
 
+    model_config = _SIDECAR_CONFIG
+
     id: str
     summary: str
     start: str
@@ -49,6 +58,8 @@ class SidecarExpectedEvent(BaseModel):
             appear in the actual attendees list (case-insensitive).
     """
 
+    model_config = _SIDECAR_CONFIG
+
     action: Literal["create", "update", "delete"]
     title: str
     start_time: str
@@ -73,6 +84,8 @@ class SidecarMemoryEntry(BaseModel):
         confidence: Confidence level.  Defaults to ``"medium"``.
     """
 
+    model_config = _SIDECAR_CONFIG
+
     category: Literal["preferences", "people", "vocabulary", "patterns", "corrections"]
     key: str
     value: str
@@ -87,8 +100,9 @@ class SidecarSpec(BaseModel):
         category: Sample category (mirrors directory structure).
         tolerance: Assertion tolerance level.  Defaults to ``"moderate"``.
         owner: Owner name injected into the pipeline.  Defaults to ``"Alice"``.
-        reference_datetime: ISO 8601 datetime used as ``now`` in the
-            pipeline.  Defaults to ``"2026-02-20T10:00:00"``.
+        reference_datetime: Datetime used as ``now`` in the pipeline,
+            parsed from ISO 8601 at validation time.  Defaults to
+            ``2026-02-20T10:00:00``.
         calendar_context: List of pre-existing calendar events to inject
             as context for CRUD-aware extraction.
         expected_events: List of expected extraction results.
@@ -99,13 +113,20 @@ class SidecarSpec(BaseModel):
         notes: Optional notes about the test scenario.
     """
 
+    model_config = _SIDECAR_CONFIG
+
     description: str
     category: str
     tolerance: Literal["strict", "moderate", "relaxed"] = "moderate"
     owner: str = "Alice"
-    reference_datetime: str = "2026-02-20T10:00:00"
+    reference_datetime: datetime = datetime(2026, 2, 20, 10, 0, 0)
     calendar_context: list[SidecarCalendarEvent] = Field(default_factory=list)
     expected_events: list[SidecarExpectedEvent] = Field(default_factory=list)
     memory_context: list[SidecarMemoryEntry] | None = None
     mock_llm_response: dict[str, Any] = Field(default_factory=dict)
     notes: str | None = None
+
+    @cached_property
+    def mock_llm_text(self) -> str:
+        """``mock_llm_response`` serialized to JSON, computed once per sidecar."""
+        return json.dumps(self.mock_llm_response)
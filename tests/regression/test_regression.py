@@ -13,18 +13,20 @@ Two test functions cover mock mode (default) and live mode (``--live``):
 
 from __future__ import annotations
 
-import json
-from datetime import datetime
-from pathlib import Path
+from collections.abc import Callable, Generator
+from contextvars import ContextVar
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+from cal_ai import llm as _llm
+from cal_ai import pipeline as _pipeline
+from cal_ai.calendar.context import CalendarContext
 from cal_ai.memory.formatter import format_memory_context
 from cal_ai.models.extraction import ExtractionResult
 from cal_ai.pipeline import run_pipeline
-from tests.regression.loader import build_calendar_context
-from tests.regression.schema import SidecarSpec
+from tests.regression.loader import SampleCase
 from tests.regression.tolerance import assert_extraction_result
 
 # ---------------------------------------------------------------------------
@@ -32,22 +34,64 @@ from tests.regression.tolerance import assert_extraction_result
 # ---------------------------------------------------------------------------
 
 
-def _build_mock_response(sidecar: SidecarSpec) -> MagicMock:
-    """Build a mock ``generate_content`` return value from sidecar data.
-
-    The mock response's ``.text`` attribute returns the JSON-serialized
-    ``mock_llm_response`` from the sidecar, mimicking the Gemini SDK
-    response object.
+def _build_genai_client(mock_resp: SimpleNamespace) -> Callable[..., SimpleNamespace]:
+    """Build a stand-in for ``genai.Client`` whose models return *mock_resp*.
 
     Args:
-        sidecar: A validated sidecar spec with ``mock_llm_response``.
+        mock_resp: The response every ``generate_content`` call returns.
 
     Returns:
-        A ``MagicMock`` that behaves like a Gemini response object.
+        A factory accepting the ``genai.Client`` constructor arguments.
     """
-    mock_resp = MagicMock()
-    mock_resp.text = json.dumps(sidecar.mock_llm_response)
-    return mock_resp
+    client = SimpleNamespace(
+        models=SimpleNamespace(generate_content=lambda *_a, **_kw: mock_resp),
+    )
+    return lambda *_a, **_kw: client
+
+
+# ---------------------------------------------------------------------------
+# Module-wide patches
+# ---------------------------------------------------------------------------
+
+# Calendar context for the running test, served by the patched
+# ``fetch_calendar_context`` below.  Set and reset by ``_serve_cal_ctx``.
+_current_cal_ctx: ContextVar[CalendarContext] = ContextVar("_current_cal_ctx")
+
+
+@pytest.fixture(autouse=True, scope="module")
+def _patch_calendar() -> Generator[None, None, None]:
+    """Patch the calendar collaborators once for every test in this module.
+
+    ``fetch_calendar_context`` returns whatever the current test stored in
+    ``_current_cal_ctx``, and ``get_calendar_credentials`` returns a dummy
+    credentials object, so no test talks to Google Calendar.
+    """
+    with (
+        patch.object(
+            _pipeline,
+            "fetch_calendar_context",
+            new=lambda *_a, **_kw: _current_cal_ctx.get(),
+        ),
+        patch.object(
+            _pipeline,
+            "get_calendar_credentials",
+            return_value=MagicMock(),
+        ),
+    ):
+        yield
+
+
+@pytest.fixture(autouse=True)
+def _serve_cal_ctx(sample_case: SampleCase) -> Generator[None, None, None]:
+    """Serve this test's ``CalendarContext``, then restore the previous value.
+
+    Resetting the token keeps one test's context from outliving it.
+    """
+    token = _current_cal_ctx.set(sample_case.cal_ctx)
+    try:
+        yield
+    finally:
+        _current_cal_ctx.reset(token)
 
 
 # ---------------------------------------------------------------------------
@@ -57,26 +101,23 @@ def _build_mock_response(sidecar: SidecarSpec) -> MagicMock:
 
 @pytest.mark.regression
 def test_mock_extraction(
-    sample_case: tuple[Path, SidecarSpec],
+    sample_case: SampleCase,
     monkeypatch_env: dict[str, str],
 ) -> None:
     """Mock mode: patch LLM and calendar context, then assert extraction.
 
     Steps:
-    1. Load sidecar (provided by ``sample_case`` via ``pytest_generate_tests``).
-    2. Build ``CalendarContext`` from sidecar's ``calendar_context`` entries.
-    3. Patch ``genai.Client.models.generate_content`` to return the sidecar's
-       ``mock_llm_response``.
-    4. Patch ``cal_ai.pipeline.fetch_calendar_context`` to return the built
-       ``CalendarContext``.
-    5. Call ``run_pipeline()`` with ``dry_run=True``.
-    6. Assert the extraction result via ``assert_extraction_result()``.
+    1. Receive the prebuilt ``SampleCase`` (sidecar, ``CalendarContext``
+       and mock response) via ``pytest_generate_tests``.
+    2. Patch ``genai.Client`` so ``models.generate_content`` returns the
+       sample's mock response.
+    3. Serve the built ``CalendarContext`` through the module-wide
+       ``fetch_calendar_context`` patch.
+    4. Call ``run_pipeline()`` with ``dry_run=True``.
+    5. Assert the extraction result via ``assert_extraction_result()``.
     """
-    txt_path, sidecar = sample_case
-    ref_dt = datetime.fromisoformat(sidecar.reference_datetime)
-    cal_ctx = build_calendar_context(sidecar)
-
-    mock_resp = _build_mock_response(sidecar)
+    tc = sample_case
+    sidecar = tc.sidecar
 
     # Build memory patches: inject sidecar memory_context when present.
     memory_entries = sidecar.memory_context or []
@@ -91,31 +132,29 @@ def test_mock_extraction(
     )
 
     with (
-        patch(
-            "cal_ai.llm.genai.Client",
-        ) as mock_genai_cls,
-        patch(
-            "cal_ai.pipeline.fetch_calendar_context",
-            return_value=cal_ctx,
+        patch.object(
+            _llm.genai,
+            "Client",
+            new=_build_genai_client(tc.mock_resp),
         ),
-        patch(
-            "cal_ai.pipeline.get_calendar_credentials",
-            return_value=MagicMock(),
-        ),
-        patch(
-            "cal_ai.pipeline.MemoryStore",
+        patch.object(
+            _pipeline,
+            "MemoryStore",
             mock_memory_store_cls,
         ),
-        patch(
-            "cal_ai.pipeline.format_memory_context",
+        patch.object(
+            _pipeline,
+            "format_memory_context",
             mock_format_memory,
         ),
-        patch(
-            "cal_ai.pipeline._resolve_memory_db_path",
+        patch.object(
+            _pipeline,
+            "_resolve_memory_db_path",
             return_value="/tmp/regression_test_memory.db",
         ),
-        patch(
-            "cal_ai.pipeline.run_memory_write",
+        patch.object(
+            _pipeline,
+            "run_memory_write",
             return_value=MagicMock(
                 memories_added=0,
                 memories_updated=0,
@@ -124,15 +163,11 @@ def test_mock_extraction(
             ),
         ),
     ):
-        # Wire the mocked generate_content onto the client instance.
-        mock_genai_instance = mock_genai_cls.return_value
-        mock_genai_instance.models.generate_content.return_value = mock_resp
-
         result = run_pipeline(
-            transcript_path=txt_path,
+            transcript_path=tc.txt_path,
             owner=sidecar.owner,
             dry_run=True,
-            current_datetime=ref_dt,
+            current_datetime=sidecar.reference_datetime,
         )
 
     # Build ExtractionResult from pipeline's events_extracted for assertion.
@@ -147,7 +182,7 @@ def test_mock_extraction(
 @pytest.mark.regression
 @pytest.mark.live
 def test_live_extraction(
-    sample_case: tuple[Path, SidecarSpec],
+    sample_case: SampleCase,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     """Live mode: real Gemini API call, then assert extraction with tolerance.
@@ -176,9 +211,8 @@ def test_live_extraction(
     monkeypatch.setenv("GOOGLE_ACCOUNT_EMAIL", "test@example.com")
     monkeypatch.setenv("OWNER_NAME", "Test User")
 
-    txt_path, sidecar = sample_case
-    ref_dt = datetime.fromisoformat(sidecar.reference_datetime)
-    cal_ctx = build_calendar_context(sidecar)
+    tc = sample_case
+    sidecar = tc.sidecar
 
     # Build memory patches for live tests (same as mock mode).
     memory_entries = sidecar.memory_context or []
@@ -191,32 +225,27 @@ def test_live_extraction(
     )
 
     with (
-        patch(
-            "cal_ai.pipeline.fetch_calendar_context",
-            return_value=cal_ctx,
-        ),
-        patch(
-            "cal_ai.pipeline.get_calendar_credentials",
-            return_value=MagicMock(),
-        ),
-        patch(
-            "cal_ai.pipeline.MemoryStore",
+        patch.object(
+            _pipeline,
+            "MemoryStore",
             mock_memory_store_cls,
         ),
-        patch(
-            "cal_ai.pipeline.format_memory_context",
+        patch.object(
+            _pipeline,
+            "format_memory_context",
             mock_format_memory,
         ),
-        patch(
-            "cal_ai.pipeline._resolve_memory_db_path",
+        patch.object(
+            _pipeline,
+            "_resolve_memory_db_path",
             return_value="/tmp/regression_test_memory.db",
         ),
     ):
         result = run_pipeline(
-            transcript_path=txt_path,
+            transcript_path=tc.txt_path,
             owner=sidecar.owner,
             dry_run=True,
-            current_datetime=ref_dt,
+            current_datetime=sidecar.reference_datetime,
         )
 
     extraction = ExtractionResult(
@@ -13,6 +13,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Literal
 
 from rapidfuzz.fuzz import token_set_ratio
@@ -62,12 +63,45 @@ THRESHOLDS: dict[str, ToleranceThresholds] = {
     ),
 }
 
+# Time tolerances in seconds, so per-pair checks compare plain floats.
+_TOLERANCE_SECONDS: dict[str, float] = {
+    level: t.time_tolerance.total_seconds() for level, t in THRESHOLDS.items()
+}
+
 
 # ---------------------------------------------------------------------------
 # Event distance scoring for best-match pairing
 # ---------------------------------------------------------------------------
 
 
+@lru_cache(maxsize=512)
+def _parse_iso(value: str) -> datetime:
+    """Parse an ISO 8601 string, caching the result per distinct string.
+
+    The same timestamps are parsed during pairing and again during the
+    per-pair tolerance checks.  ``ValueError`` propagates uncached.
+    """
+    return datetime.fromisoformat(value)
+
+
+@lru_cache(maxsize=4096)
+def _cached_title_ratio(first: str, second: str) -> float:
+    """Memoized ``token_set_ratio``; call via :func:`_title_ratio`."""
+    return token_set_ratio(first, second)
+
+
+def _title_ratio(actual: str, expected: str) -> float:
+    """Return ``token_set_ratio`` for two strings, memoized per unordered pair.
+
+    The score is symmetric, so arguments are ordered before the cache
+    lookup.  Pairing scores every title pair, and the per-pair title
+    assertion then reuses that score instead of recomputing it.
+    """
+    if expected < actual:
+        actual, expected = expected, actual
+    return _cached_title_ratio(actual, expected)
+
+
 def _action_distance(actual: str, expected: str) -> float:
     """Return 0.0 if actions match, 1000.0 otherwise.
 
@@ -82,7 +116,7 @@ def _title_distance(actual: str, expected: str) -> float:
     Uses ``rapidfuzz.fuzz.token_set_ratio`` (0-100).  Distance is
     ``100 - ratio`` so that identical titles yield 0.0 distance.
     """
-    ratio = token_set_ratio(actual, expected)
+    ratio = _title_ratio(actual, expected)
     return 100.0 - ratio
 
 
@@ -97,8 +131,8 @@ def _time_distance(actual_iso: str | None, expected_iso: str | None) -> float:
         return 10000.0
 
     try:
-        actual_dt = datetime.fromisoformat(actual_iso)
-        expected_dt = datetime.fromisoformat(expected_iso)
+        actual_dt = _parse_iso(actual_iso)
+        expected_dt = _parse_iso(expected_iso)
     except ValueError:
         return 10000.0
 
@@ -234,6 +268,30 @@ def _best_match_pairs(
     if not actual_events or not expected_events:
         return []
 
+    # Fast path: with a single row or column the optimal assignment is
+    # simply its cheapest cell.
+    if len(expected_events) == 1:
+        exp = expected_events[0]
+        dists = [_event_pair_distance(act, exp) for act in actual_events]
+        best = min(range(len(dists)), key=dists.__getitem__)
+        return [(actual_events[best], exp, dists[best])]
+    if len(actual_events) == 1:
+        act = actual_events[0]
+        dists = [_event_pair_distance(act, exp) for exp in expected_events]
+        best = min(range(len(dists)), key=dists.__getitem__)
+        return [(act, expected_events[best], dists[best])]
+
+    # Fast path: positionally identical lists pair at zero cost, which no
+    # other assignment can beat.  Whitespace-only titles score 0, not 100.
+    if len(actual_events) == len(expected_events) and all(
+        act.action == exp.action
+        and act.title == exp.title
+        and act.title.strip()
+        and _time_distance(act.start_time, exp.start_time) == 0.0
+        for act, exp in zip(actual_events, expected_events, strict=True)
+    ):
+        return [(act, exp, 0.0) for act, exp in zip(actual_events, expected_events, strict=True)]
+
     # Build cost matrix: rows = actual, cols = expected.
     cost_matrix: list[list[float]] = []
     for act in actual_events:
@@ -260,19 +318,19 @@ def _best_match_pairs(
 def _assert_time_within_tolerance(
     actual_iso: str | None,
     expected_iso: str | None,
-    tolerance: timedelta,
+    tolerance_seconds: float,
     label: str,
 ) -> None:
-    """Assert that two ISO datetime strings are within *tolerance*.
+    """Assert that two ISO datetime strings are within *tolerance_seconds*.
 
     Args:
         actual_iso: Actual ISO 8601 string from extraction.
         expected_iso: Expected ISO 8601 string from sidecar.
-        tolerance: Maximum allowed difference.
+        tolerance_seconds: Maximum allowed difference, in seconds.
         label: Human-readable label for error messages (e.g. "start_time").
 
     Raises:
-        AssertionError: If the times differ by more than *tolerance*.
+        AssertionError: If the times differ by more than *tolerance_seconds*.
     """
     __tracebackhide__ = True
 
@@ -283,19 +341,20 @@ def _assert_time_within_tolerance(
         raise AssertionError(f"{label}: expected {expected_iso!r} but got None")
 
     try:
-        actual_dt = datetime.fromisoformat(actual_iso)
+        actual_dt = _parse_iso(actual_iso)
     except ValueError as exc:
         raise AssertionError(f"{label}: cannot parse actual {actual_iso!r}: {exc}") from exc
 
     try:
-        expected_dt = datetime.fromisoformat(expected_iso)
+        expected_dt = _parse_iso(expected_iso)
     except ValueError as exc:
         raise AssertionError(f"{label}: cannot parse expected {expected_iso!r}: {exc}") from exc
 
-    diff = abs(actual_dt - expected_dt)
-    if diff > tolerance:
+    diff_s = abs((actual_dt - expected_dt).total_seconds())
+    if diff_s > tolerance_seconds:
         raise AssertionError(
-            f"{label}: time difference {diff} exceeds tolerance {tolerance} "
+            f"{label}: time difference {timedelta(seconds=diff_s)} exceeds tolerance "
+            f"{timedelta(seconds=tolerance_seconds)} "
             f"(actual={actual_iso!r}, expected={expected_iso!r})"
         )
 
@@ -316,7 +375,7 @@ def _assert_title_match(
         AssertionError: If the ratio is below *min_ratio*.
     """
     __tracebackhide__ = True
-    ratio = token_set_ratio(actual, expected)
+    ratio = _title_ratio(actual, expected)
     if ratio < min_ratio:
         raise AssertionError(
             f"Title mismatch: token_set_ratio={ratio:.1f} < {min_ratio} "
@@ -344,12 +403,11 @@ def _assert_attendees_contain(
     if not required_substrings:
         return
 
-    actual_lower = [a.lower() for a in actual_attendees]
+    # One lowercased haystack; NUL keeps a match from spanning two attendees.
+    haystack = "\x00".join(actual_attendees).lower()
 
     for required in required_substrings:
-        req_lower = required.lower()
-        found = any(req_lower in attendee for attendee in actual_lower)
-        if not found:
+        if required.lower() not in haystack:
             raise AssertionError(
                 f"Attendee check failed: {required!r} not found in "
                 f"actual attendees {actual_attendees}"
@@ -361,19 +419,20 @@ def _assert_attendees_contain(
 # ---------------------------------------------------------------------------
 
 
-def _build_context_id_set(sidecar: SidecarSpec) -> set[int]:
-    """Build the set of valid integer IDs from the sidecar's calendar context.
+def _context_id_max(sidecar: SidecarSpec) -> int:
+    """Return the largest valid integer ID in the sidecar's calendar context.
 
     Integer IDs are 1-based and sequential, matching the convention used
-    by :func:`~tests.regression.loader.build_calendar_context`.
+    by :func:`~tests.regression.loader.build_calendar_context`, so an ID
+    is valid iff ``1 <= id <= _context_id_max(sidecar)``.
 
     Args:
         sidecar: A validated sidecar spec.
 
     Returns:
-        A set of valid integer IDs (e.g., ``{1, 2, 3}``).
+        The number of context events (``0`` when the context is empty).
     """
-    return set(range(1, len(sidecar.calendar_context) + 1))
+    return len(sidecar.calendar_context)
 
 
 def _resolve_delete_time_from_context(
@@ -430,13 +489,11 @@ def assert_extraction_result(
 
     level: Literal["strict", "moderate", "relaxed"] = sidecar.tolerance
     thresholds = THRESHOLDS[level]
+    tolerance_seconds = _TOLERANCE_SECONDS[level]
 
     expected_events = sidecar.expected_events
     actual_events = actual.events
 
-    # Build the set of valid context IDs for validation.
-    valid_context_ids = _build_context_id_set(sidecar)
-
     # --- Event count check ---
     count_diff = abs(len(actual_events) - len(expected_events))
     if count_diff > thresholds.event_count_tolerance:
@@ -446,6 +503,13 @@ def assert_extraction_result(
             f"got {len(actual_events)}"
         )
 
+    # Nothing to pair: the count check above is the whole assertion.
+    if not actual_events or not expected_events:
+        return
+
+    # Valid context IDs are exactly 1..ctx_max.
+    ctx_max = _context_id_max(sidecar)
+
     # --- Best-match pairing ---
     pairs = _best_match_pairs(actual_events, expected_events)
 
@@ -502,7 +566,7 @@ def assert_extraction_result(
             _assert_time_within_tolerance(
                 actual_event.start_time,
                 expected_start,
-                thresholds.time_tolerance,
+                tolerance_seconds,
                 f"{pair_label} start_time",
             )
         except AssertionError as exc:
@@ -513,7 +577,7 @@ def assert_extraction_result(
             _assert_time_within_tolerance(
                 actual_event.end_time,
                 expected_end,
-                thresholds.time_tolerance,
+                tolerance_seconds,
                 f"{pair_label} end_time",
             )
         except AssertionError as exc:
@@ -523,15 +587,15 @@ def assert_extraction_result(
         if expected_event.existing_event_id_required:
             if actual_event.existing_event_id is None:
                 errors.append(f"{pair_label}: existing_event_id is required but was None")
-            elif not valid_context_ids:
+            elif ctx_max == 0:
                 errors.append(
                     f"{pair_label}: existing_event_id_required=True but "
                     f"calendar_context is empty (no valid IDs to match against)"
                 )
-            elif actual_event.existing_event_id not in valid_context_ids:
+            elif not 1 <= actual_event.existing_event_id <= ctx_max:
                 errors.append(
                     f"{pair_label}: existing_event_id={actual_event.existing_event_id} "
-                    f"is not in valid context IDs {sorted(valid_context_ids)}"
+                    f"is not in valid context IDs {list(range(1, ctx_max + 1))}"
                 )
 
         # Attendees subset check.
@@ -3,41 +3,52 @@
 from __future__ import annotations
 
 from pathlib import Path
-from unittest.mock import MagicMock, create_autospec
+from types import SimpleNamespace
 
 import pytest
-from google.oauth2.credentials import Credentials
 
 from cal_ai.calendar.auth import SCOPES
 
+# Minimal OAuth client secrets body written by ``tmp_credentials_file``.
+_CREDS_JSON = '{"installed": {"client_id": "fake", "client_secret": "fake"}}'
+
 
 @pytest.fixture()
-def mock_credentials() -> MagicMock:
-    """Return a mock Credentials object that reports as valid."""
-    creds = create_autospec(Credentials, instance=True)
-    creds.valid = True
-    creds.expired = False
-    creds.refresh_token = "fake-refresh-token"
-    creds.to_json.return_value = '{"token": "fake"}'
-    return creds
+def mock_credentials() -> SimpleNamespace:
+    """Return a stand-in Credentials object that reports as valid.
+
+    A plain namespace rather than ``create_autospec(Credentials)``:
+    ``get_calendar_credentials`` only reads ``valid``, ``expired`` and
+    ``refresh_token``, and token I/O is patched out in these tests.
+    """
+    return SimpleNamespace(
+        valid=True,
+        expired=False,
+        refresh_token="fake-refresh-token",
+        to_json=lambda: '{"token": "fake"}',
+    )
 
 
 @pytest.fixture()
-def mock_expired_credentials() -> MagicMock:
-    """Return a mock Credentials object that is expired but has a refresh token."""
-    creds = create_autospec(Credentials, instance=True)
-    creds.valid = False
-    creds.expired = True
-    creds.refresh_token = "fake-refresh-token"
-    creds.to_json.return_value = '{"token": "refreshed"}'
-    return creds
+def mock_expired_credentials() -> SimpleNamespace:
+    """Return a stand-in Credentials object that is expired but has a refresh token.
+
+    A plain namespace, like :func:`mock_credentials`; ``to_json`` returns
+    the body that would be saved after a refresh.
+    """
+    return SimpleNamespace(
+        valid=False,
+        expired=True,
+        refresh_token="fake-refresh-token",
+        to_json=lambda: '{"token": "refreshed"}',
+    )
 
 
 @pytest.fixture()
 def tmp_credentials_file(tmp_path: Path) -> Path:
     """Write a minimal credentials.json to a temp directory and return its path."""
     creds_path = tmp_path / "credentials.json"
-    creds_path.write_text('{"installed": {"client_id": "fake", "client_secret": "fake"}}')
+    creds_path.write_text(_CREDS_JSON)
     return creds_path
 
 
@@ -47,7 +58,7 @@ def tmp_token_file(tmp_path: Path) -> Path:
     return tmp_path / "token.json"
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def scopes() -> list[str]:
     """Return the expected OAuth 2.0 scopes."""
     return SCOPES
@@ -19,10 +19,10 @@ Test matrix (7 tests):
 from __future__ import annotations
 
 from pathlib import Path
-from unittest.mock import MagicMock, create_autospec, patch
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
 
 import pytest
-from google.oauth2.credentials import Credentials
 
 from cal_ai.calendar.auth import SCOPES, get_calendar_credentials
 from cal_ai.calendar.exceptions import CalendarAuthError
@@ -31,7 +31,9 @@ from cal_ai.calendar.exceptions import CalendarAuthError
 class TestLoadCachedTokenValid:
     """Cached token exists and is still valid -- no browser flow needed."""
 
-    def test_load_cached_token_valid(self, tmp_path: Path, mock_credentials: MagicMock) -> None:
+    def test_load_cached_token_valid(
+        self, tmp_path: Path, mock_credentials: SimpleNamespace
+    ) -> None:
         """Valid cached token is returned directly without launching a browser flow."""
         token_path = tmp_path / "token.json"
         token_path.write_text('{"token": "cached"}')
@@ -58,7 +60,7 @@ class TestExpiredTokenRefresh:
     """Token is expired but has a refresh token -- refresh should be attempted."""
 
     def test_expired_token_triggers_refresh(
-        self, tmp_path: Path, mock_expired_credentials: MagicMock
+        self, tmp_path: Path, mock_expired_credentials: SimpleNamespace
     ) -> None:
         """Expired token with a refresh token triggers creds.refresh() and saves."""
         token_path = tmp_path / "token.json"
@@ -89,16 +91,14 @@ class TestExpiredTokenRefresh:
         assert result is refreshed_creds
 
     def test_refresh_failure_triggers_reauth(
-        self, tmp_path: Path, mock_expired_credentials: MagicMock
+        self, tmp_path: Path, mock_expired_credentials: SimpleNamespace
     ) -> None:
         """When token refresh fails, browser OAuth flow is launched as fallback."""
         token_path = tmp_path / "token.json"
         creds_path = tmp_path / "credentials.json"
         creds_path.write_text('{"installed": {}}')
 
-        fresh_creds = create_autospec(Credentials, instance=True)
-        fresh_creds.valid = True
-        fresh_creds.to_json.return_value = '{"token": "new"}'
+        fresh_creds = SimpleNamespace(valid=True, to_json=lambda: '{"token": "new"}')
 
         with (
             patch(
@@ -134,9 +134,7 @@ class TestNoCachedToken:
         creds_path = tmp_path / "credentials.json"
         creds_path.write_text('{"installed": {}}')
 
-        fresh_creds = create_autospec(Credentials, instance=True)
-        fresh_creds.valid = True
-        fresh_creds.to_json.return_value = '{"token": "new"}'
+        fresh_creds = SimpleNamespace(valid=True, to_json=lambda: '{"token": "new"}')
 
         with (
             patch(
@@ -186,9 +184,7 @@ class TestTokenSavedAfterAuth:
         creds_path = tmp_path / "credentials.json"
         creds_path.write_text('{"installed": {}}')
 
-        fresh_creds = create_autospec(Credentials, instance=True)
-        fresh_creds.valid = True
-        fresh_creds.to_json.return_value = '{"token": "brand-new"}'
+        fresh_creds = SimpleNamespace(valid=True, to_json=lambda: '{"token": "brand-new"}')
 
         with (
             patch(
@@ -220,9 +216,7 @@ class TestCorrectScopesRequested:
             ' "token_uri": "https://oauth2.googleapis.com/token"}}'
         )
 
-        mock_creds = create_autospec(Credentials, instance=True)
-        mock_creds.valid = True
-        mock_creds.to_json.return_value = '{"token": "test"}'
+        mock_creds = SimpleNamespace(valid=True, to_json=lambda: '{"token": "test"}')
 
         mock_flow_instance = MagicMock()
         mock_flow_instance.run_local_server.return_value = mock_creds
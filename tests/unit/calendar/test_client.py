@@ -5,7 +5,7 @@ create, read, update, delete operations, as well as duplicate detection,
 conflict detection, and the :func:`~cal_ai.calendar.sync.sync_events`
 orchestrator.
 
-Test matrix (24 tests):
+Test matrix (36 tests):
 
 Create Operations (5):
 | test_create_event_success | Happy path create | insert() called, response returned |
@@ -24,23 +24,42 @@ Update Operations (3):
 | test_find_and_update_event_found | Search + update | Matching event updated |
 | test_find_and_update_event_not_found | No match | update() NOT called, None |
 
-Delete Operations (3):
+Delete Operations (4):
 | test_delete_event_success | Delete by ID | delete() called |
 | test_find_and_delete_event_found | Search + delete | True returned |
 | test_find_and_delete_event_not_found | No match | False returned |
+| test_find_and_delete_event_stops_paging_on_match | Match on page 1 | Page 2 not fetched |
 
-Duplicate Detection (5):
+Duplicate Detection (6):
 | test_duplicate_detected_same_title_overlapping_time | Same title + overlap | Returns existing |
 | test_no_duplicate_same_title_different_time | Same title, no overlap | Returns None |
 | test_no_duplicate_different_title_same_time | Different title, same time | Returns None |
 | test_duplicate_detection_case_insensitive | "Lunch" vs "lunch" | Detected |
 | test_duplicate_detection_partial_overlap | Same title, partial overlap | Detected |
+| test_duplicate_detection_casefold | "STRASSE" vs "Straße" | Detected |
 
 Conflict Detection (4):
 | test_conflict_detected_overlapping_time | Different title, overlap | Returns conflict |
 | test_no_conflict_adjacent_events | Back-to-back | No conflict |
 | test_no_conflict_non_overlapping | Separate times | No conflict |
 | test_multiple_conflicts_detected | Overlaps with 2+ events | All returned |
+
+Sync Orchestration (8):
+| test_sync_events_dispatches_create | action="create" | create_event() called |
+| test_sync_events_dispatches_update | action="update" | find_and_update_event() called |
+| test_sync_events_dispatches_delete | action="delete" | find_and_delete_event() called |
+| test_sync_events_returns_summary | Mixed actions | Correct SyncResult counts |
+| test_sync_events_lists_existing_once | Mixed actions | One list() call |
+| test_sync_events_skips_duplicate_created_earlier_in_batch | Same create x2 | 1 created, 1 skip |
+| test_sync_events_falls_back_when_prefetch_fails | Prefetch list() fails | Event still created |
+| test_sync_events_continues_on_partial_failure | One create fails | Others processed |
+
+Credential Refresh (1):
+| test_refresh_rebinds_events_resource | 401 refresh rebuilds service | New events() used |
+
+Time Parsing (2):
+| test_parse_event_times_strips_tz_and_caches | Repeated offset timestamp | Naive, parsed once |
+| test_parse_event_times_invalid_is_none | Garbage start string | (None, end) |
 """
 
 from __future__ import annotations
@@ -48,7 +67,11 @@ from __future__ import annotations
 from datetime import datetime
 from unittest.mock import MagicMock, patch
 
-from cal_ai.calendar.client import GoogleCalendarClient
+from cal_ai.calendar.client import (
+    GoogleCalendarClient,
+    _parse_event_times,
+    parse_api_datetime,
+)
 from cal_ai.calendar.sync import sync_events
 from cal_ai.models.extraction import ValidatedEvent
 
@@ -112,12 +135,7 @@ def _build_mock_service(
 
     # List pagination support.
     if list_pages is not None:
-        execute_calls = [MagicMock(return_value=page) for page in list_pages]
-        events.list.return_value.execute = MagicMock(side_effect=[p() for p in execute_calls])
-        # Actually, we need the list mock to return an object whose execute() returns pages
-        # in sequence.
-        side_effects = list(list_pages)
-        events.list.return_value.execute = MagicMock(side_effect=side_effects)
+        events.list.return_value.execute = MagicMock(side_effect=list(list_pages))
     elif list_items is not None:
         events.list.return_value.execute.return_value = {
             "items": list_items,
@@ -192,7 +210,7 @@ class TestCreateEventMinimalFields:
         service.events.return_value.insert.assert_called_once()
         # Verify the body passed to insert() does not contain location
         call_kwargs = service.events.return_value.insert.call_args
-        body = call_kwargs[1]["body"] if "body" in call_kwargs[1] else call_kwargs[0][1]
+        body = call_kwargs[1]["body"]
         assert "location" not in body
 
 
@@ -416,7 +434,7 @@ class TestFindAndUpdateEventNotFound:
 
 
 # ===========================================================================
-# Delete Operations (3 tests)
+# Delete Operations (4 tests)
 # ===========================================================================
 
 
@@ -473,8 +491,36 @@ class TestFindAndDeleteEventNotFound:
         service.events.return_value.delete.assert_not_called()
 
 
+class TestFindAndDeleteEventStopsPagingOnMatch:
+    """A match on the first page means later pages are never requested."""
+
+    def test_find_and_delete_event_stops_paging_on_match(self) -> None:
+        """Only one list() page is fetched, with a partial-response selector."""
+        page1 = {
+            "items": [
+                _make_google_event(
+                    "Team Standup",
+                    datetime(2026, 3, 10, 9, 0),
+                    datetime(2026, 3, 10, 10, 0),
+                    event_id="del-1",
+                ),
+            ],
+            "nextPageToken": "token-page2",
+        }
+        page2 = {"items": []}
+        service = _build_mock_service(list_pages=[page1, page2])
+        client = _make_client(service)
+
+        result = client.find_and_delete_event(_make_event())
+
+        assert result is True
+        events = service.events.return_value
+        assert events.list.return_value.execute.call_count == 1
+        assert events.list.call_args[1]["fields"] == "items(id,summary,start,end),nextPageToken"
+
+
 # ===========================================================================
-# Duplicate Detection (5 tests)
+# Duplicate Detection (6 tests)
 # ===========================================================================
 
 
@@ -564,6 +610,23 @@ class TestDuplicateDetectionPartialOverlap:
         assert result is not None
 
 
+class TestDuplicateDetectionCasefold:
+    """Title comparison uses full Unicode case folding."""
+
+    def test_duplicate_detection_casefold(self) -> None:
+        """'STRASSE FAIR' and 'Straße Fair' are the same title."""
+        existing = _make_google_event(
+            summary="STRASSE FAIR",
+            start=datetime(2026, 3, 10, 9, 0),
+            end=datetime(2026, 3, 10, 10, 0),
+        )
+        event = _make_event(title="Straße Fair")
+
+        result = GoogleCalendarClient._is_duplicate(event, [existing])
+
+        assert result is existing
+
+
 # ===========================================================================
 # Conflict Detection (4 tests)
 # ===========================================================================
@@ -649,7 +712,7 @@ class TestMultipleConflictsDetected:
 
 
 # ===========================================================================
-# Sync Orchestration (5 tests)
+# Sync Orchestration (8 tests)
 # ===========================================================================
 
 
@@ -749,6 +812,72 @@ class TestSyncEventsReturnsSummary:
         assert result.total_processed == 3
 
 
+class TestSyncEventsListsExistingOnce:
+    """Existing events are fetched once per sync, not once per event."""
+
+    def test_sync_events_lists_existing_once(self) -> None:
+        """A mixed create/update/delete sync issues a single list() call."""
+        existing = _make_google_event(
+            summary="Team Standup",
+            start=datetime(2026, 3, 10, 9, 0),
+            end=datetime(2026, 3, 10, 10, 0),
+            event_id="mix-1",
+        )
+        service = _build_mock_service(list_items=[existing])
+        client = _make_client(service)
+        events = [
+            _make_event(
+                title="Create Event",
+                action="create",
+                start_time=datetime(2026, 3, 11, 9, 0),
+                end_time=datetime(2026, 3, 11, 10, 0),
+            ),
+            _make_event(title="Team Standup", action="update"),
+            _make_event(title="Team Standup", action="delete"),
+        ]
+
+        result = sync_events(events, client)
+
+        assert result.total_processed == 3
+        service.events.return_value.list.assert_called_once()
+        list_kwargs = service.events.return_value.list.call_args[1]
+        assert list_kwargs["timeMin"] == "2026-03-09T09:00:00Z"
+        assert list_kwargs["timeMax"] == "2026-03-12T10:00:00Z"
+
+
+class TestSyncEventsSeesItsOwnChanges:
+    """The shared snapshot reflects events created earlier in the same sync."""
+
+    def test_sync_events_skips_duplicate_created_earlier_in_batch(self) -> None:
+        """A second identical create in one sync is skipped as a duplicate."""
+        service = _build_mock_service()
+        client = _make_client(service)
+        events = [_make_event(), _make_event()]
+
+        result = sync_events(events, client)
+
+        assert result.created == 1
+        assert result.skipped == 1
+        service.events.return_value.insert.assert_called_once()
+
+
+class TestSyncEventsPrefetchFailure:
+    """A failed prefetch falls back to per-event lookups."""
+
+    def test_sync_events_falls_back_when_prefetch_fails(self) -> None:
+        """The event is still created when the up-front list() call fails."""
+        service = _build_mock_service()
+        service.events.return_value.list.return_value.execute = MagicMock(
+            side_effect=[RuntimeError("list failed"), {"items": []}]
+        )
+        client = _make_client(service)
+
+        result = sync_events([_make_event()], client)
+
+        assert result.created == 1
+        assert result.failures == []
+
+
 class TestSyncEventsContinuesOnPartialFailure:
     """One event fails but others are still processed."""
 
@@ -791,3 +920,59 @@ class TestSyncEventsContinuesOnPartialFailure:
         assert result.created == 1
         assert len(result.failures) == 1
         assert result.failures[0]["event"] == "Failing Event"
+
+
+# ===========================================================================
+# Credential Refresh (1 test)
+# ===========================================================================
+
+
+class TestRefreshCredentialsRebindsEvents:
+    """A credential refresh must not leave calls on the stale service."""
+
+    def test_refresh_rebinds_events_resource(self) -> None:
+        """After _refresh_credentials(), CRUD calls go to the rebuilt service."""
+        old_service = _build_mock_service()
+        new_service = _build_mock_service()
+        client = _make_client(old_service)
+
+        with (
+            patch("cal_ai.calendar.client.build", return_value=new_service),
+            patch("google.auth.transport.requests.Request"),
+        ):
+            client._refresh_credentials()
+
+        client.delete_event("evt-99")
+
+        new_service.events.return_value.delete.assert_called_once()
+        old_service.events.return_value.delete.assert_not_called()
+
+
+# ===========================================================================
+# Time Parsing (2 tests)
+# ===========================================================================
+
+
+class TestParseEventTimes:
+    """Parsing of start/end values from API event resources."""
+
+    def test_parse_event_times_strips_tz_and_caches(self) -> None:
+        """Offset timestamps become naive and repeats hit the parse cache."""
+        parse_api_datetime.cache_clear()
+        event = {
+            "start": {"dateTime": "2026-03-10T09:00:00-07:00"},
+            "end": {"dateTime": "2026-03-10T10:00:00-07:00"},
+        }
+
+        first = _parse_event_times(event)
+        second = _parse_event_times(dict(event))
+
+        assert first == (datetime(2026, 3, 10, 9, 0), datetime(2026, 3, 10, 10, 0))
+        assert second == first
+        assert parse_api_datetime.cache_info().hits == 2
+
+    def test_parse_event_times_invalid_is_none(self) -> None:
+        """An unparseable value yields None without affecting the other side."""
+        event = {"start": {"dateTime": "not-a-time"}, "end": {"date": "2026-03-11"}}
+
+        assert _parse_event_times(event) == (None, datetime(2026, 3, 11))
@@ -3,7 +3,7 @@
 Covers :class:`~cal_ai.calendar.context.CalendarContext` and
 :func:`~cal_ai.calendar.context.fetch_calendar_context`:
 
-Test matrix (9 tests):
+Test matrix (10 tests):
 
 Normal Fetch (3):
 | test_fetch_with_events             | Multi events  | Text + ID map |
@@ -23,14 +23,15 @@ ID Mapping (2):
 Event Metadata (1):
 | test_event_meta_populated          | Multi events  | Title + time  |
 
-Edge Cases (1):
+Edge Cases (2):
 | test_all_day_event_formatting      | All-day event | Date field OK |
+| test_sort_by_parsed_start          | Offsets, junk | Parsed order  |
 """
 
 from __future__ import annotations
 
 from datetime import datetime
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 from cal_ai.calendar.context import fetch_calendar_context
 
@@ -75,24 +76,26 @@ def _make_all_day_event(
     }
 
 
-def _make_mock_client(
-    events: list[dict] | None = None,
-    error: Exception | None = None,
-) -> MagicMock:
-    """Create a mock GoogleCalendarClient.
+class _StubClient:
+    """Minimal stand-in for ``GoogleCalendarClient`` with a canned ``list_events``.
 
     Args:
         events: Events to return from list_events().
         error: Exception to raise from list_events().
     """
-    client = MagicMock()
-    if error is not None:
-        client.list_events.side_effect = error
-    elif events is not None:
-        client.list_events.return_value = events
-    else:
-        client.list_events.return_value = []
-    return client
+
+    def __init__(
+        self,
+        events: list[dict] | None = None,
+        error: Exception | None = None,
+    ) -> None:
+        self._events = events if events is not None else []
+        self._error = error
+
+    def list_events(self, time_min: datetime, time_max: datetime) -> list[dict]:
+        if self._error is not None:
+            raise self._error
+        return self._events
 
 
 # ===========================================================================
@@ -119,7 +122,7 @@ class TestFetchWithEvents:
                 event_id="gcal-def",
             ),
         ]
-        client = _make_mock_client(events=events)
+        client = _StubClient(events=events)
         now = datetime(2026, 3, 10, 0, 0)
 
         ctx = fetch_calendar_context(client, now)
@@ -150,7 +153,7 @@ class TestEventsSortedChronologically:
                 event_id="gcal-earlier",
             ),
         ]
-        client = _make_mock_client(events=events)
+        client = _StubClient(events=events)
         now = datetime(2026, 3, 10, 0, 0)
 
         ctx = fetch_calendar_context(client, now)
@@ -181,7 +184,7 @@ class TestEventWithLocation:
                 location="Starbucks on Main St",
             ),
         ]
-        client = _make_mock_client(events=events)
+        client = _StubClient(events=events)
         now = datetime(2026, 3, 10, 0, 0)
 
         ctx = fetch_calendar_context(client, now)
@@ -201,7 +204,7 @@ class TestFetchEmptyCalendar:
 
     def test_fetch_empty_calendar(self) -> None:
         """Returns empty context with event_count=0."""
-        client = _make_mock_client(events=[])
+        client = _StubClient(events=[])
         now = datetime(2026, 3, 10, 0, 0)
 
         ctx = fetch_calendar_context(client, now)
@@ -221,7 +224,7 @@ class TestFetchErrorReturnsEmpty:
 
     def test_fetch_error_returns_empty(self) -> None:
         """Returns empty context and logs a warning on fetch failure."""
-        client = _make_mock_client(error=RuntimeError("Network timeout"))
+        client = _StubClient(error=RuntimeError("Network timeout"))
         now = datetime(2026, 3, 10, 0, 0)
 
         with patch("cal_ai.calendar.context.logger") as mock_logger:
@@ -254,7 +257,7 @@ class TestIdMapIntegersStartAtOne:
             )
             for i in range(3)
         ]
-        client = _make_mock_client(events=events)
+        client = _StubClient(events=events)
         now = datetime(2026, 3, 10, 0, 0)
 
         ctx = fetch_calendar_context(client, now)
@@ -281,7 +284,7 @@ class TestIdMapReverseLookup:
                 event_id="uuid-beta-456",
             ),
         ]
-        client = _make_mock_client(events=events)
+        client = _StubClient(events=events)
         now = datetime(2026, 3, 10, 0, 0)
 
         ctx = fetch_calendar_context(client, now)
@@ -315,7 +318,7 @@ class TestEventMetaPopulated:
                 event_id="gcal-def",
             ),
         ]
-        client = _make_mock_client(events=events)
+        client = _StubClient(events=events)
         now = datetime(2026, 3, 10, 0, 0)
 
         ctx = fetch_calendar_context(client, now)
@@ -328,7 +331,7 @@ class TestEventMetaPopulated:
 
 
 # ===========================================================================
-# Edge Cases (1 test)
+# Edge Cases (2 tests)
 # ===========================================================================
 
 
@@ -340,7 +343,7 @@ class TestAllDayEventFormatting:
         events = [
             _make_all_day_event("Company Holiday", "2026-03-15", event_id="gcal-allday"),
         ]
-        client = _make_mock_client(events=events)
+        client = _StubClient(events=events)
         now = datetime(2026, 3, 10, 0, 0)
 
         ctx = fetch_calendar_context(client, now)
@@ -349,3 +352,35 @@ class TestAllDayEventFormatting:
         assert "Company Holiday" in ctx.events_text
         assert "2026-03-15" in ctx.events_text
         assert ctx.id_map[1] == "gcal-allday"
+
+
+class TestSortByParsedStart:
+    """Sorting compares parsed start times, not raw strings."""
+
+    def test_sort_by_parsed_start(self) -> None:
+        """Offsets are dropped, dates sort as midnight, junk sorts last."""
+        events = [
+            {"id": "gcal-bad", "summary": "Broken", "start": {"dateTime": "2026-03-09T99:00"}},
+            {
+                "id": "gcal-offset",
+                "summary": "Call",
+                "start": {"dateTime": "2026-03-10T09:00:00-07:00"},
+            },
+            {"id": "gcal-allday", "summary": "Holiday", "start": {"date": "2026-03-10"}},
+            {
+                "id": "gcal-naive",
+                "summary": "Standup",
+                "start": {"dateTime": "2026-03-10T08:30:00"},
+            },
+        ]
+        client = _StubClient(events=events)
+        now = datetime(2026, 3, 10, 0, 0)
+
+        ctx = fetch_calendar_context(client, now)
+
+        assert list(ctx.id_map.values()) == [
+            "gcal-allday",
+            "gcal-naive",
+            "gcal-offset",
+            "gcal-bad",
+        ]
@@ -4,8 +4,9 @@ Covers the ``map_to_google_event`` function which converts
 :class:`~cal_ai.models.extraction.ValidatedEvent` instances into Google
 Calendar API event body dicts.
 
-Test matrix (7 tests): full event, minimal, default end time,
-attendees, description reasoning, timezone, ISO format.
+Test matrix (8 tests): full event, minimal, default end time,
+attendees, owner case-insensitive split, description reasoning, timezone,
+ISO format.
 """
 
 from __future__ import annotations
@@ -118,6 +119,19 @@ class TestMapEventWithAttendees:
         assert "Other attendees:" in body["description"]
 
 
+class TestMapEventOwnerMatchedCaseInsensitively:
+    """Owner is recognised regardless of case and kept out of the description."""
+
+    def test_map_event_owner_case_insensitive_split(self) -> None:
+        """Upper-cased owner becomes the attendee; others keep their order."""
+        event = _make_event(attendees=["Charlie", OWNER_EMAIL.upper(), "Bob"])
+        body = map_to_google_event(event, TIMEZONE, OWNER_EMAIL)
+
+        assert body["attendees"] == [{"email": OWNER_EMAIL}]
+        assert "Other attendees: Charlie, Bob" in body["description"]
+        assert OWNER_EMAIL.upper() not in body["description"]
+
+
 class TestMapEventDescriptionIncludesReasoning:
     """Description field includes LLM reasoning and assumptions."""
 
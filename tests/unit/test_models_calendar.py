@@ -6,6 +6,8 @@ and aggregation behavior.
 
 from __future__ import annotations
 
+import pytest
+
 from cal_ai.models.calendar import SyncResult
 
 
@@ -165,3 +167,11 @@ class TestSyncResultImport:
 
         assert result.created == 1
         assert len(result.failures) == 1
+
+    def test_sync_result_has_no_instance_dict(self) -> None:
+        """SyncResult uses slots, so stray attributes are rejected."""
+        result = SyncResult()
+
+        assert not hasattr(result, "__dict__")
+        with pytest.raises(AttributeError):
+            result.total = 3  # type: ignore[attr-defined]
@@ -11,17 +11,27 @@ Tests cover:
 from __future__ import annotations
 
 import json
+from datetime import datetime
 from pathlib import Path
 
 import pytest
+from rapidfuzz.fuzz import token_set_ratio
 
 from cal_ai.models.extraction import ExtractedEvent, ExtractionResult
-from tests.regression.loader import build_calendar_context, discover_samples, load_sidecar
+from tests.regression.loader import (
+    build_calendar_context,
+    build_mock_response,
+    discover_samples,
+    load_sidecar,
+)
 from tests.regression.schema import SidecarCalendarEvent, SidecarExpectedEvent, SidecarSpec
 from tests.regression.tolerance import (
     _best_match_pairs,
+    _cached_title_ratio,
+    _parse_iso,
     _time_distance,
     _title_distance,
+    _title_ratio,
     assert_extraction_result,
 )
 
@@ -121,9 +131,31 @@ class TestSidecarSchema:
             notes="This is a note.",
         )
         assert spec.tolerance == "strict"
+        assert spec.reference_datetime == datetime(2026, 3, 1, 14, 0, 0)
         assert len(spec.calendar_context) == 1
         assert spec.calendar_context[0].location == "Room A"
 
+    def test_unknown_field_rejected(self):
+        """Misspelled sidecar keys should fail validation instead of being ignored."""
+        from pydantic import ValidationError
+
+        with pytest.raises(ValidationError):
+            _make_expected_event(existing_event_id=1)
+
+    def test_sidecar_is_frozen(self):
+        """Sidecars are read-only once loaded."""
+        from pydantic import ValidationError
+
+        spec = _make_sidecar()
+        with pytest.raises(ValidationError):
+            spec.owner = "Bob"
+
+    def test_mock_llm_text_serialized_once(self):
+        """mock_llm_text is the JSON of mock_llm_response, cached per instance."""
+        spec = _make_sidecar(mock_llm_response={"events": [], "summary": "None"})
+        assert json.loads(spec.mock_llm_text) == spec.mock_llm_response
+        assert spec.mock_llm_text is spec.mock_llm_text
+
     def test_invalid_tolerance_rejected(self):
         """An invalid tolerance value should raise ValidationError."""
         from pydantic import ValidationError
@@ -166,6 +198,16 @@ class TestLoader:
         assert spec.tolerance == "strict"
         assert len(spec.expected_events) == 1
 
+    def test_load_sidecar_invalid_json(self, tmp_path: Path):
+        """Malformed JSON should surface as a pydantic ValidationError."""
+        from pydantic import ValidationError
+
+        json_path = tmp_path / "broken.expected.json"
+        json_path.write_text('{"description": "Broken", ')
+
+        with pytest.raises(ValidationError):
+            load_sidecar(json_path)
+
     def test_discover_samples_pairs_files(self, tmp_path: Path):
         """discover_samples should pair .txt with .expected.json files."""
         # Create a sample with sidecar.
@@ -183,6 +225,9 @@ class TestLoader:
         results = discover_samples(tmp_path)
         assert len(results) == 1
         assert results[0][0].name == "hello.txt"
+        assert results[0].cal_ctx.event_count == 0
+        assert results[0].sidecar.reference_datetime == datetime(2026, 2, 20, 10, 0, 0)
+        assert json.loads(results[0].mock_resp.text) == {}
 
     def test_discover_samples_recursive(self, tmp_path: Path):
         """discover_samples should find samples in subdirectories."""
@@ -196,6 +241,17 @@ class TestLoader:
         assert len(results) == 1
         assert "crud" in str(results[0][0])
 
+    def test_build_mock_response_shared_for_identical_payloads(self):
+        """Sidecars with the same mock response share one response stub."""
+        payload = {"events": [], "summary": "Nothing"}
+        first = build_mock_response(_make_sidecar(mock_llm_response=payload))
+        second = build_mock_response(_make_sidecar(mock_llm_response=dict(payload)))
+        other = build_mock_response(_make_sidecar(mock_llm_response={"events": []}))
+
+        assert first is second
+        assert other is not first
+        assert json.loads(first.text) == payload
+
     def test_build_calendar_context_empty(self):
         """An empty calendar_context should produce empty CalendarContext."""
         sidecar = _make_sidecar()
@@ -231,6 +287,10 @@ class TestLoader:
         assert "[2] Lunch" in ctx.events_text
         assert "Room 101" in ctx.events_text
         assert ctx.event_meta[1]["title"] == "Meeting A"
+        assert ctx.events_text == (
+            "[1] Meeting A | 2026-02-20T10:00:00 - 2026-02-20T11:00:00 | Room 101\n"
+            "[2] Lunch | 2026-02-20T12:00:00 - 2026-02-20T13:00:00"
+        )
 
 
 # ===========================================================================
@@ -255,6 +315,14 @@ class TestDistanceFunctions:
         dist = _title_distance("Team Standup", "Birthday Party")
         assert dist > 50.0
 
+    def test_title_ratio_is_symmetric_and_cached(self):
+        """Swapped arguments should hit the same cached score."""
+        first = _title_ratio("Sprint Planning", "Planning for Sprint 12")
+        hits = _cached_title_ratio.cache_info().hits
+        assert _title_ratio("Planning for Sprint 12", "Sprint Planning") == first
+        assert _cached_title_ratio.cache_info().hits == hits + 1
+        assert first == token_set_ratio("Sprint Planning", "Planning for Sprint 12")
+
     def test_time_distance_identical(self):
         """Identical times should yield distance 0."""
         assert _time_distance("2026-02-20T09:00:00", "2026-02-20T09:00:00") == 0.0
@@ -268,6 +336,17 @@ class TestDistanceFunctions:
         """Both None should yield distance 0."""
         assert _time_distance(None, None) == 0.0
 
+    def test_time_distance_unparseable_is_penalized(self):
+        """An unparseable timestamp should yield the large penalty, every time."""
+        assert _time_distance("not-a-date", "2026-02-20T09:00:00") == 10000.0
+        assert _time_distance("not-a-date", "2026-02-20T09:00:00") == 10000.0
+
+    def test_parse_iso_is_cached(self):
+        """Repeated parses of the same string should reuse the cached datetime."""
+        first = _parse_iso("2026-02-20T09:00:00")
+        assert first == datetime(2026, 2, 20, 9, 0, 0)
+        assert _parse_iso("2026-02-20T09:00:00") is first
+
 
 class TestBestMatchPairing:
     """Tests for the best-match event pairing algorithm."""
@@ -305,6 +384,50 @@ class TestBestMatchPairing:
         pairs = _best_match_pairs(actual, expected)
         assert len(pairs) == 1
 
+    def test_single_pair_reports_distance(self):
+        """The single-pair fast path should still report the composite distance."""
+        actual = [_make_extracted_event(start_time="2026-02-20T10:00:00")]
+        expected = [_make_expected_event()]
+        pairs = _best_match_pairs(actual, expected)
+        assert pairs[0][2] == pytest.approx(60.0)
+
+    def test_aligned_identical_events_pair_positionally(self):
+        """Identical lists in the same order should pair index-for-index."""
+        actual = [
+            _make_extracted_event(title="Standup", start_time="2026-02-20T09:00:00"),
+            _make_extracted_event(title="Lunch", start_time="2026-02-20T12:00:00"),
+        ]
+        expected = [
+            _make_expected_event(title="Standup", start_time="2026-02-20T09:00:00"),
+            _make_expected_event(title="Lunch", start_time="2026-02-20T12:00:00"),
+        ]
+        pairs = _best_match_pairs(actual, expected)
+        assert [(p[0], p[1], p[2]) for p in pairs] == [
+            (actual[0], expected[0], 0.0),
+            (actual[1], expected[1], 0.0),
+        ]
+
+    def test_single_expected_picks_closest_actual(self):
+        """With one expected event, the cheapest actual event is chosen."""
+        actual = [
+            _make_extracted_event(title="Lunch", start_time="2026-02-20T12:00:00"),
+            _make_extracted_event(title="Team Standup", start_time="2026-02-20T09:15:00"),
+        ]
+        expected = [_make_expected_event()]
+        pairs = _best_match_pairs(actual, expected)
+        assert [(p[0], p[1]) for p in pairs] == [(actual[1], expected[0])]
+        assert pairs[0][2] == pytest.approx(15.0)
+
+    def test_single_actual_picks_closest_expected(self):
+        """With one actual event, the cheapest expected event is chosen."""
+        actual = [_make_extracted_event()]
+        expected = [
+            _make_expected_event(title="Lunch", start_time="2026-02-20T12:00:00"),
+            _make_expected_event(),
+        ]
+        pairs = _best_match_pairs(actual, expected)
+        assert [(p[0], p[1], p[2]) for p in pairs] == [(actual[0], expected[1], 0.0)]
+
     def test_hungarian_beats_greedy(self):
         """Optimal matching should handle cases where greedy would fail.
 
@@ -476,6 +599,30 @@ class TestToleranceCrossCutting:
         with pytest.raises(AssertionError, match="Event count mismatch"):
             assert_extraction_result(result, sidecar)
 
+    def test_title_mismatch_reports_exact_ratio(self):
+        """A fuzzy title failure should report the real score, not the cutoff sentinel."""
+        event = _make_extracted_event(title="Team Lunch")
+        result = _make_extraction_result([event])
+        sidecar = _make_sidecar(
+            tolerance="moderate",
+            expected_events=[_make_expected_event(title="Team Standup")],
+        )
+        with pytest.raises(AssertionError, match=r"token_set_ratio=57\.1 < 80\.0"):
+            assert_extraction_result(result, sidecar)
+
+    def test_time_failure_reports_timedeltas(self):
+        """Time failures should render the difference and tolerance as timedeltas."""
+        event = _make_extracted_event(start_time="2026-02-20T10:00:00")
+        result = _make_extraction_result([event])
+        sidecar = _make_sidecar(
+            tolerance="strict",
+            expected_events=[_make_expected_event()],
+        )
+        with pytest.raises(
+            AssertionError, match="time difference 1:00:00 exceeds tolerance 0:30:00"
+        ):
+            assert_extraction_result(result, sidecar)
+
     def test_attendees_subset_check(self):
         """Attendees that are required must appear in actual."""
         event = _make_extracted_event(attendees=["Alice", "Bob", "Charlie"])
@@ -502,6 +649,19 @@ class TestToleranceCrossCutting:
         with pytest.raises(AssertionError, match="Dave"):
             assert_extraction_result(result, sidecar)
 
+    def test_attendee_substring_does_not_span_attendees(self):
+        """A required substring must match within a single attendee."""
+        event = _make_extracted_event(attendees=["Alice", "Bob"])
+        result = _make_extraction_result([event])
+        sidecar = _make_sidecar(
+            tolerance="moderate",
+            expected_events=[
+                _make_expected_event(attendees_contain=["ice bob"]),
+            ],
+        )
+        with pytest.raises(AssertionError, match="ice bob"):
+            assert_extraction_result(result, sidecar)
+
     def test_existing_event_id_required(self):
         """When existing_event_id_required=True, None should fail."""
         event = _make_extracted_event(
@@ -527,6 +687,15 @@ class TestToleranceCrossCutting:
         sidecar = _make_sidecar(tolerance="strict", expected_events=[])
         assert_extraction_result(result, sidecar)
 
+    def test_no_actual_events_within_count_tolerance_passes(self):
+        """A missing event allowed by the count tolerance leaves nothing to pair."""
+        result = _make_extraction_result([])
+        sidecar = _make_sidecar(
+            tolerance="moderate",
+            expected_events=[_make_expected_event()],
+        )
+        assert_extraction_result(result, sidecar)
+
     def test_existing_event_id_out_of_range_fails(self):
         """An existing_event_id outside the context domain should fail."""
         event = _make_extracted_event(